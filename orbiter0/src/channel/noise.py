@@ -55,8 +55,25 @@ SIMPLIFICATIONS:
 
 import numpy as np
 
+# 🎓 RANDOM NUMBER GENERATOR
+# NumPy's modern Generator (PCG64) is faster than the legacy
+# np.random.* functions. One module-level instance is shared by every
+# call; use set_noise_seed() for repeatable runs.
+_rng = np.random.default_rng()
 
-def add_awgn(signal, snr_db):
+
+def set_noise_seed(seed):
+    """
+    Reseed the noise generator so add_awgn() repeats exactly.
+
+    (np.random.seed() no longer affects the noise - it only seeds the
+    legacy global generator.)
+    """
+    global _rng
+    _rng = np.random.default_rng(seed)
+
+
+def add_awgn(signal, snr_db, scratch=None, out=None):
     """
     Add Additive White Gaussian Noise to a signal.
 
@@ -82,13 +99,22 @@ def add_awgn(signal, snr_db):
     snr_db : float
         Desired Signal-to-Noise Ratio in decibels
         (e.g., 20 dB = good quality, 5 dB = poor quality)
+    scratch : ndarray, optional
+        Reusable noise buffer (same length and dtype as the result).
+        When it fits, the noise is written into it instead of a new
+        array - handy when adding noise to many equal-length signals.
+        It is overwritten on every call, so don't share it between threads
+    out : ndarray, optional
+        Buffer for the noisy result (same rules as scratch). May be the
+        input signal itself to add the noise in place
 
     Returns
     -------
     noisy_signal : ndarray
-        Signal with noise added
+        Signal with noise added (this IS out when one was used)
     noise : ndarray
-        The noise that was added (useful for visualization)
+        The noise that was added (useful for visualization).
+        This IS the scratch buffer when one was used
     """
     # Step 1: Calculate signal power
     # 🎓 Power is the mean of the squared signal values
@@ -110,15 +136,23 @@ def add_awgn(signal, snr_db):
     noise_std = np.sqrt(noise_power)
 
     # Step 5: Generate Gaussian noise
-    # 🎓 np.random.normal(mean, std_dev, size)
-    # Mean = 0 (noise centered around zero)
-    # Std = calculated noise_std
-    # Size = same as signal length
-    noise = np.random.normal(0, noise_std, len(signal))
+    # 🎓 standard_normal gives mean 0, std 1 - scaling by noise_std
+    # gives the std we need. Float32 signals get float32 noise directly,
+    # so the sum below doesn't upcast to float64
+    dtype = np.float32 if signal.dtype == np.float32 else np.float64
+    if (scratch is not None and scratch.shape == (len(signal),)
+            and scratch.dtype == dtype):
+        noise = _rng.standard_normal(dtype=dtype, out=scratch)
+    else:
+        noise = _rng.standard_normal(len(signal), dtype=dtype)
+    noise *= noise_std
 
     # Step 6: Add noise to signal
     # 🎓 This is the "Additive" part of AWGN!
-    noisy_signal = signal + noise
+    if out is not None and out.shape == noise.shape and out.dtype == dtype:
+        noisy_signal = np.add(signal, noise, out=out)
+    else:
+        noisy_signal = signal + noise
 
     return noisy_signal, noise
 
@@ -253,6 +287,9 @@ def linear_to_db(linear_value):
 #   - SNR is a ratio of POWER (signal²), not amplitude
 #   - dB scale is logarithmic (20 dB is 100×, not 2× 10 dB)
 #   - Negative dB means noise is stronger than signal!
+#   - Noise comes from this module's own Generator: call set_noise_seed(),
+#     not np.random.seed(), to make runs repeatable
+#   - With scratch=..., the returned noise array is reused by the next call
 
 
 # ═══ FUTURE IMPROVEMENTS ═══
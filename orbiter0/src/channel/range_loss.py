@@ -52,6 +52,50 @@ SIMPLIFICATIONS:
 import numpy as np
 
 
+def free_space_gain(distance_km, reference_distance_km=1.0):
+    """
+    Amplitude factor for free space path loss (no signal needed).
+
+    🎓 TEACHING NOTE:
+    Range loss is the SAME number for every sample of the signal.
+    Computing it once as a scalar lets a simulation combine it with
+    other constant losses and touch the signal array only once.
+
+    Parameters
+    ----------
+    distance_km : float
+        Distance from transmitter to receiver in kilometers
+    reference_distance_km : float
+        Reference distance for normalization (default: 1 km)
+
+    Returns
+    -------
+    attenuation_factor : float
+        Multiplicative factor: (reference / distance)²
+    """
+    # Handle edge case: zero or negative distance
+    if distance_km <= 0:
+        distance_km = reference_distance_km  # No loss
+
+    # 🎓 Factor = (reference / actual)²
+    # Example: At 10 km with 1 km reference:
+    #   attenuation = (1/10)² = 0.01 = 1% of original power
+    return (reference_distance_km / distance_km) ** 2
+
+
+def free_space_loss_db(distance_km, reference_distance_km=1.0):
+    """
+    Power loss in dB caused by free_space_gain() (positive number).
+
+    🎓 TEACHING NOTE:
+    The gain multiplies the AMPLITUDE, so the power changes by gain²:
+        loss_dB = -10*log10(gain²) = -20*log10(gain)
+    This is exactly what you would measure by comparing mean(signal²)
+    before and after apply_free_space_loss() - without touching a signal.
+    """
+    return -20 * np.log10(free_space_gain(distance_km, reference_distance_km))
+
+
 def apply_free_space_loss(signal, distance_km, reference_distance_km=1.0):
     """
     Apply free space path loss to a signal (simplified model).
@@ -89,15 +133,8 @@ def apply_free_space_loss(signal, distance_km, reference_distance_km=1.0):
     attenuation_factor : float
         The multiplicative attenuation factor applied
     """
-    # Handle edge case: zero or negative distance
-    if distance_km <= 0:
-        distance_km = reference_distance_km  # No loss
-
     # Step 1: Calculate attenuation factor using inverse square law
-    # 🎓 Factor = (reference / actual)²
-    # Example: At 10 km with 1 km reference:
-    #   attenuation = (1/10)² = 0.01 = 1% of original power
-    attenuation_factor = (reference_distance_km / distance_km) ** 2
+    attenuation_factor = free_space_gain(distance_km, reference_distance_km)
 
     # Step 2: Apply attenuation to signal
     # 🎓 Simply multiply signal by the attenuation factor
@@ -202,6 +239,49 @@ def apply_attenuation_db(signal, attenuation_db):
 #   - This is free space only - no atmospheric effects
 
 
+def atmospheric_loss_db(elevation_angle_deg=30, weather='clear'):
+    """
+    Atmospheric absorption in dB (no signal needed).
+
+    Same model as apply_atmospheric_loss(), returned as a scalar so it
+    can be folded into a single combined gain.
+
+    Parameters
+    ----------
+    elevation_angle_deg : float
+        Angle above horizon in degrees (0-90)
+    weather : str
+        Weather condition: 'clear', 'cloudy', 'rain'
+
+    Returns
+    -------
+    loss_db : float
+        Atmospheric loss in dB (positive number)
+    """
+    # 🎓 WEATHER IMPACT
+    # Different weather = different absorption
+    weather_loss_db = {
+        'clear': 0.5,
+        'cloudy': 1.5,
+        'rain': 4.0
+    }
+    base_loss = weather_loss_db.get(weather, 0.5)
+
+    # 🎓 ELEVATION ANGLE IMPACT
+    # Lower angles = signal passes through more atmosphere
+    # Use cosecant law approximation
+    elevation_angle_deg = np.clip(elevation_angle_deg, 5, 90)  # Avoid division by zero
+
+    # At zenith (90°), path through atmosphere is minimum (factor = 1)
+    # At lower angles, path is longer (factor > 1)
+    elevation_rad = np.radians(elevation_angle_deg)
+    path_length_factor = 1 / np.sin(elevation_rad)
+
+    # 🎓 TOTAL ATMOSPHERIC LOSS
+    # Longer path → more absorption
+    return base_loss * path_length_factor
+
+
 def apply_atmospheric_loss(signal, elevation_angle_deg=30, weather='clear'):
     """
     Apply simplified atmospheric absorption loss.
@@ -241,28 +321,8 @@ def apply_atmospheric_loss(signal, elevation_angle_deg=30, weather='clear'):
     loss_db : float
         Atmospheric loss in dB
     """
-    # 🎓 WEATHER IMPACT
-    # Different weather = different absorption
-    weather_loss_db = {
-        'clear': 0.5,
-        'cloudy': 1.5,
-        'rain': 4.0
-    }
-    base_loss = weather_loss_db.get(weather, 0.5)
-
-    # 🎓 ELEVATION ANGLE IMPACT
-    # Lower angles = signal passes through more atmosphere
-    # Use cosecant law approximation
-    elevation_angle_deg = np.clip(elevation_angle_deg, 5, 90)  # Avoid division by zero
-
-    # At zenith (90°), path through atmosphere is minimum (factor = 1)
-    # At lower angles, path is longer (factor > 1)
-    elevation_rad = np.radians(elevation_angle_deg)
-    path_length_factor = 1 / np.sin(elevation_rad)
-
-    # 🎓 TOTAL ATMOSPHERIC LOSS
-    # Longer path → more absorption
-    total_loss_db = base_loss * path_length_factor
+    # 🎓 TOTAL ATMOSPHERIC LOSS (weather + elevation, see atmospheric_loss_db)
+    total_loss_db = atmospheric_loss_db(elevation_angle_deg, weather)
 
     # Apply attenuation
     attenuated_signal = apply_attenuation_db(signal, -total_loss_db)
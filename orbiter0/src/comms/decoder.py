@@ -50,13 +50,31 @@ LEARNING GOALS:
 SIMPLIFICATIONS:
   - Only Hamming(7,4) (simplest useful code)
   - Can correct 1 bit error, detect 2 bit errors
-  - Not optimized for speed
+  - Per-nibble functions are written for clarity, not speed
+    (the *_message functions are the fast whole-stream versions)
 
 ═══════════════════════════════════════════════════════════════════
 """
 
 import numpy as np
 
+# 🎓 OPTIONAL JIT COMPILER
+# Numba compiles the whole-message Hamming loops to machine code.
+# Without it, the same math runs as NumPy operations on bit columns.
+# Each kernel compiles on its first call, so importing this module
+# stays cheap.
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        # No-op stand-in so the @njit(...) decorators below still work
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 def add_parity_bit(data_bits):
     """
@@ -372,6 +390,129 @@ def decode_bytes_with_hamming(encoded_bits):
     }
 
 
+def hamming_encode_message(data_bits):
+    """
+    Hamming(7,4)-encode a whole bit stream at once.
+
+    🎓 TEACHING NOTE:
+    Same code as hamming_encode_4bit(), but for thousands of bits.
+    Instead of calling a Python function per nibble, the bits are
+    viewed as a table with 4 columns (d1 d2 d3 d4) and each parity
+    bit is the XOR of three whole columns:
+
+        [d1 d2 d3 d4]   →   [p1 p2 d1 p3 d2 d3 d4]
+        [d1 d2 d3 d4]   →   [p1 p2 d1 p3 d2 d3 d4]
+             ...                     ...
+
+    Parameters
+    ----------
+    data_bits : list of int or ndarray
+        Bits to encode (0s and 1s). Zero-padded to a multiple of 4
+
+    Returns
+    -------
+    encoded_bits : ndarray of uint8
+        7 bits for every 4 input bits
+    """
+    bits = np.ascontiguousarray(data_bits, dtype=np.uint8)
+    padding = -len(bits) % 4
+    if padding:
+        bits = np.concatenate((bits, np.zeros(padding, dtype=np.uint8)))
+
+    if _HAS_NUMBA:
+        return _hamming_encode_kernel(bits)
+
+    d1, d2, d3, d4 = bits.reshape(-1, 4).T
+    encoded = np.empty((len(d1), 7), dtype=np.uint8)
+    encoded[:, 0] = d1 ^ d2 ^ d4   # p1
+    encoded[:, 1] = d1 ^ d3 ^ d4   # p2
+    encoded[:, 2] = d1
+    encoded[:, 3] = d2 ^ d3 ^ d4   # p3
+    encoded[:, 4] = d2
+    encoded[:, 5] = d3
+    encoded[:, 6] = d4
+    return encoded.ravel()
+
+
+def hamming_decode_message(encoded_bits):
+    """
+    Decode (and correct) a whole Hamming(7,4) bit stream at once.
+
+    🎓 TEACHING NOTE:
+    The syndrome of every 7-bit codeword is computed in one go; rows
+    with a nonzero syndrome get the indicated bit flipped, exactly as
+    in hamming_decode_4bit().
+
+    Parameters
+    ----------
+    encoded_bits : list of int or ndarray
+        Received bits. A trailing partial codeword (< 7 bits) is ignored
+
+    Returns
+    -------
+    data_bits : ndarray of uint8
+        4 corrected data bits for every 7-bit codeword
+    """
+    bits = np.ascontiguousarray(encoded_bits, dtype=np.uint8)
+    bits = bits[:len(bits) - len(bits) % 7]
+
+    if _HAS_NUMBA:
+        return _hamming_decode_kernel(bits)
+
+    r = bits.reshape(-1, 7).copy()
+    syndrome = ((r[:, 0] ^ r[:, 2] ^ r[:, 4] ^ r[:, 6])
+                | (r[:, 1] ^ r[:, 2] ^ r[:, 5] ^ r[:, 6]) << 1
+                | (r[:, 3] ^ r[:, 4] ^ r[:, 5] ^ r[:, 6]) << 2)
+
+    # Flip the bit the syndrome points at (1-indexed position)
+    rows = np.nonzero(syndrome)[0]
+    r[rows, syndrome[rows] - 1] ^= 1
+
+    return r[:, [2, 4, 5, 6]].ravel()
+
+
+@njit
+def _hamming_encode_kernel(bits):
+    """Numba kernel for hamming_encode_message() (len(bits) % 4 == 0)."""
+    n = len(bits) // 4
+    out = np.empty(n * 7, dtype=np.uint8)
+    for i in range(n):
+        d1 = bits[4 * i]
+        d2 = bits[4 * i + 1]
+        d3 = bits[4 * i + 2]
+        d4 = bits[4 * i + 3]
+        j = 7 * i
+        out[j] = d1 ^ d2 ^ d4
+        out[j + 1] = d1 ^ d3 ^ d4
+        out[j + 2] = d1
+        out[j + 3] = d2 ^ d3 ^ d4
+        out[j + 4] = d2
+        out[j + 5] = d3
+        out[j + 6] = d4
+    return out
+
+
+@njit
+def _hamming_decode_kernel(bits):
+    """Numba kernel for hamming_decode_message() (len(bits) % 7 == 0)."""
+    n = len(bits) // 7
+    out = np.empty(n * 4, dtype=np.uint8)
+    r = np.empty(7, dtype=np.uint8)
+    for i in range(n):
+        for k in range(7):
+            r[k] = bits[7 * i + k]
+        syndrome = ((r[0] ^ r[2] ^ r[4] ^ r[6])
+                    | (r[1] ^ r[2] ^ r[5] ^ r[6]) << 1
+                    | (r[3] ^ r[4] ^ r[5] ^ r[6]) << 2)
+        if syndrome != 0:
+            r[syndrome - 1] ^= 1
+        out[4 * i] = r[2]
+        out[4 * i + 1] = r[4]
+        out[4 * i + 2] = r[5]
+        out[4 * i + 3] = r[6]
+    return out
+
+
 def demonstrate_hamming_correction():
     """
     Demonstrate Hamming code correcting an error.
@@ -430,6 +571,15 @@ def demonstrate_hamming_correction():
 #   - More than 1 error = correction FAILS
 #   - Syndrome 0 = no error
 #   - Position counting starts at 1, not 0
+#   - hamming_encode_message()/hamming_decode_message() return uint8
+#     arrays, not lists
+#   - With Numba installed, every new process compiles the kernels on
+#     their first call (the first FEC transmission is a bit slower).
+#     They are NOT cached on disk (cache=True): Numba's cache records the
+#     importing module's name, and this module is imported both as
+#     src.comms.decoder (self_test) and comms.decoder (Streamlit)
+#   - The kernels expect contiguous uint8 arrays; the *_message()
+#     wrappers convert with np.ascontiguousarray first
 
 
 # ═══ FUTURE IMPROVEMENTS ═══
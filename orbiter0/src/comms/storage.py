@@ -26,7 +26,7 @@ DATABASE SCHEMA:
 │  - snr_db (signal-to-noise ratio)                            │
 │  - packets_total (number of packets)                          │
 │  - packets_corrupted (failed CRC)                            │
-│  - metadata (JSON for extra info)                            │
+│  - metadata (JSON bytes for extra info)                      │
 └──────────────────────────────────────────────────────────────┘
 
 LEARNING GOALS:
@@ -40,15 +40,154 @@ SIMPLIFICATIONS:
   - JSON for flexible metadata
   - No complex queries or indexes
 
+PERFORMANCE NOTES:
+  - The INSERT statement lives at module scope (_INSERT_SQL) so SQLite's
+    per-connection statement cache always sees the identical string
+  - Connections run in autocommit mode; bulk saves wrap every row in one
+    explicit BEGIN/COMMIT instead of one transaction per row
+  - Metadata is (de)serialized with orjson when it is installed, falling
+    back to the standard json module otherwise
+  - init_database() remembers which files it already set up, so calling
+    it before every save costs a file-exists check, not a connection
+  - batch_session() groups many save_mission() calls into one transaction
+
 ═══════════════════════════════════════════════════════════════════
 """
 
+import os
 import sqlite3
 import json
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Dict, Optional
 import time
 
+# 🎓 OPTIONAL FAST JSON
+# orjson is a C implementation of JSON that is several times faster than
+# the standard library. It returns BYTES instead of str, which SQLite
+# stores happily in the BLOB metadata column. If it isn't installed we
+# fall back to the built-in json module (same results, just slower).
+try:
+    import orjson as _orjson
+
+    def _dumps(obj):
+        # OPT_SERIALIZE_NUMPY: pipeline metadata contains numpy floats
+        return _orjson.dumps(obj, option=_orjson.OPT_SERIALIZE_NUMPY)
+
+    _loads = _orjson.loads
+except ImportError:
+    def _json_default(obj):
+        # NumPy values json can't handle: arrays → lists, scalars → floats/ints
+        if hasattr(obj, 'tolist'):
+            return obj.tolist()
+        if hasattr(obj, 'item'):
+            return obj.item()
+        raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+    def _dumps(obj):
+        return json.dumps(obj, default=_json_default).encode('utf-8')
+
+    _loads = json.loads
+
+
+# ┌────────────────────────────────────────────────────────┐
+# │           PREPARED STATEMENT REUSE                     │
+# ├────────────────────────────────────────────────────────┤
+# │                                                        │
+# │  SQL string ──► statement cache ──► compiled plan      │
+# │       │              │                                 │
+# │       │              └─ HIT (same string) → reuse!     │
+# │       └─ pinned at module scope = always a HIT         │
+# │                                                        │
+# └────────────────────────────────────────────────────────┘
+
+# 🎓 Number of compiled statements each connection remembers
+# (Python's default is 128 - we raise it for bulk work)
+_CACHED_STATEMENTS = 256
+
+# 🎓 The one and only INSERT we ever run. Keeping it as a constant means
+# SQLite can skip re-parsing it for every row we save.
+_INSERT_SQL = (
+    'INSERT INTO missions ('
+    'timestamp, message_sent, message_received, ber, snr_db, '
+    'packets_total, packets_corrupted, metadata'
+    ') VALUES (?, ?, ?, ?, ?, ?, ?, ?)'
+)
+
+
+def _connect(db_path):
+    """
+    Open a connection with statement caching and autocommit enabled.
+
+    🎓 TEACHING NOTE:
+    isolation_level=None puts SQLite in "autocommit" mode: every statement
+    commits on its own unless we explicitly say BEGIN. That lets bulk
+    operations choose their own (single!) transaction boundary.
+    """
+    return sqlite3.connect(
+        str(db_path),
+        cached_statements=_CACHED_STATEMENTS,
+        isolation_level=None
+    )
+
+
+# 🎓 READ-ONLY CONNECTION CACHE
+# Dashboards call query_missions() / get_mission_statistics() over and over.
+# Opening a connection each time costs more than the query itself, so the
+# read side keeps one shared connection per database file.
+#   mode=ro               → this connection can never write (safe to share)
+#   check_same_thread=False → Streamlit/async readers may use it from any
+#                             thread while writers keep their own connection
+# Entries are (connection, file identity): a connection still points at
+# the OLD file after it is deleted and recreated, so a different
+# (device, inode) means the cached connection must be reopened.
+_RO_CONN_CACHE = {}
+
+
+def _file_id(path):
+    """(device, inode) of a file - changes when the file is replaced."""
+    st = os.stat(path)
+    return (st.st_dev, st.st_ino)
+
+
+def _close_ro_conn(db_path):
+    """Close and forget the cached read-only connection for db_path."""
+    cached = _RO_CONN_CACHE.pop(str(db_path), None)
+    if cached is not None:
+        cached[0].close()
+
+
+def _ro_conn(db_path):
+    """
+    Return the shared read-only connection for db_path (opened on first use).
+
+    🎓 TEACHING NOTE:
+    The 'file:...?mode=ro' form is an SQLite URI - it only works with
+    uri=True. Rows come back as sqlite3.Row so callers can use dict(row).
+    Writers (save_mission, clear_database, ...) still use _connect().
+    """
+    path = str(db_path)
+    file_id = _file_id(path)
+    cached = _RO_CONN_CACHE.get(path)
+    if cached is not None and cached[1] == file_id:
+        return cached[0]
+
+    # First use, or the file was replaced since we opened it
+    _close_ro_conn(path)
+    conn = sqlite3.connect(
+        f'file:{path}?mode=ro',
+        uri=True,
+        check_same_thread=False,
+        cached_statements=_CACHED_STATEMENTS
+    )
+    conn.row_factory = sqlite3.Row
+    _RO_CONN_CACHE[path] = (conn, file_id)
+    return conn
+
+
+# 🎓 Database files init_database() has already created the table in
+_INITIALIZED_DBS = set()
+
 
 def get_default_db_path():
     """Get the default database path."""
@@ -83,9 +222,17 @@ def init_database(db_path=None):
     else:
         db_path = Path(db_path)
 
+    # 🎓 ALREADY DONE? The table can't disappear while the file exists
+    if str(db_path) in _INITIALIZED_DBS and db_path.exists():
+        return db_path
+
+    # A reader cached for an earlier file at this path would keep seeing
+    # that (deleted) file - a recreated inode can even look the same
+    _close_ro_conn(db_path)
+
     # 🎓 CONNECT TO DATABASE
     # SQLite creates the file if it doesn't exist
-    conn = sqlite3.connect(str(db_path))
+    conn = _connect(db_path)
     cursor = conn.cursor()
 
     # 🎓 CREATE TABLE
@@ -100,20 +247,20 @@ def init_database(db_path=None):
             snr_db REAL,
             packets_total INTEGER,
             packets_corrupted INTEGER,
-            metadata TEXT
+            metadata BLOB
         )
     ''')
 
-    # Save changes and close
-    conn.commit()
+    # Autocommit mode - the CREATE is already saved, just close
     conn.close()
 
+    _INITIALIZED_DBS.add(str(db_path))
     return db_path
 
 
 def save_mission(message_sent, message_received, ber=None, snr_db=None,
                 packets_total=0, packets_corrupted=0, metadata=None,
-                db_path=None):
+                db_path=None, conn=None):
     """
     Save a mission record to the database.
 
@@ -144,45 +291,153 @@ def save_mission(message_sent, message_received, ber=None, snr_db=None,
         Extra info (will be stored as JSON)
     db_path : str or Path, optional
         Database path. If None, uses default.
+    conn : sqlite3.Connection, optional
+        Open connection from batch_session(). The row then becomes part
+        of that session's transaction (db_path is ignored)
 
     Returns
     -------
     mission_id : int
         ID of the inserted mission record
     """
+    # Current timestamp
+    timestamp = time.time()
+
+    # Convert metadata to JSON (bytes)
+    metadata_json = _dumps(metadata) if metadata else None
+    row = (timestamp, message_sent, message_received, ber, snr_db,
+           packets_total, packets_corrupted, metadata_json)
+
+    if conn is not None:
+        # Inside a batch_session(): committed when the session ends
+        return conn.execute(_INSERT_SQL, row).lastrowid
+
     if db_path is None:
         db_path = get_default_db_path()
 
     # Ensure database exists
-    if not Path(db_path).exists():
-        init_database(db_path)
-
-    # Current timestamp
-    timestamp = time.time()
-
-    # Convert metadata to JSON
-    metadata_json = json.dumps(metadata) if metadata else None
+    init_database(db_path)
 
     # 🎓 INSERT RECORD
-    conn = sqlite3.connect(str(db_path))
+    # Autocommit mode: a single INSERT is its own transaction
+    conn = _connect(db_path)
     cursor = conn.cursor()
 
-    cursor.execute('''
-        INSERT INTO missions (
-            timestamp, message_sent, message_received, ber, snr_db,
-            packets_total, packets_corrupted, metadata
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (timestamp, message_sent, message_received, ber, snr_db,
-          packets_total, packets_corrupted, metadata_json))
+    cursor.execute(_INSERT_SQL, row)
 
     mission_id = cursor.lastrowid
 
-    conn.commit()
     conn.close()
 
     return mission_id
 
 
+@contextmanager
+def batch_session(db_path=None):
+    """
+    One connection and ONE transaction for many save_mission() calls.
+
+    🎓 TEACHING NOTE:
+    save_mission() on its own commits (and syncs the file to disk) for
+    every row. In a loop, open a session instead and pass its connection:
+
+        with batch_session() as conn:
+            for ...:
+                save_mission(..., conn=conn)
+
+    Everything is committed once when the block ends - or rolled back
+    if an exception escapes it.
+
+    Parameters
+    ----------
+    db_path : str or Path, optional
+        Database path. If None, uses default.
+
+    Yields
+    ------
+    conn : sqlite3.Connection
+        Connection to pass as save_mission(..., conn=conn)
+    """
+    db_path = init_database(db_path)
+
+    conn = _connect(db_path)
+    try:
+        conn.execute('BEGIN')
+        yield conn
+        conn.execute('COMMIT')
+    except BaseException:
+        # Undo the partial batch so the archive stays consistent
+        conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+
+
+def save_missions(records, db_path=None):
+    """
+    Save many mission records in ONE transaction.
+
+    🎓 TEACHING NOTE:
+    In autocommit mode every INSERT is its own transaction, and every
+    transaction forces SQLite to sync the file to disk. Saving 1000 rows
+    one by one means 1000 syncs!
+
+    Wrapping them in BEGIN ... COMMIT means ONE sync for the whole batch,
+    and reusing _INSERT_SQL means the statement is compiled only once.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        Each dict uses the same keys as save_mission()'s arguments:
+        message_sent, message_received, ber, snr_db, packets_total,
+        packets_corrupted, metadata (missing keys get the same defaults)
+    db_path : str or Path, optional
+        Database path. If None, uses default.
+
+    Returns
+    -------
+    rows_saved : int
+        Number of missions inserted
+    """
+    if db_path is None:
+        db_path = get_default_db_path()
+
+    # Ensure database exists
+    init_database(db_path)
+
+    timestamp = time.time()
+
+    rows = [
+        (timestamp,
+         rec.get('message_sent'),
+         rec.get('message_received'),
+         rec.get('ber'),
+         rec.get('snr_db'),
+         rec.get('packets_total', 0),
+         rec.get('packets_corrupted', 0),
+         _dumps(rec['metadata']) if rec.get('metadata') else None)
+        for rec in records
+    ]
+
+    if not rows:
+        return 0
+
+    conn = _connect(db_path)
+    try:
+        # 🎓 ONE TRANSACTION FOR THE WHOLE BATCH
+        conn.execute('BEGIN')
+        conn.executemany(_INSERT_SQL, rows)
+        conn.execute('COMMIT')
+    except Exception:
+        # Undo the partial batch so the archive stays consistent
+        conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+
+    return len(rows)
+
+
 def query_missions(limit=100, min_snr_db=None, max_ber=None, db_path=None):
     """
     Query missions from database with optional filters.
@@ -217,9 +472,8 @@ def query_missions(limit=100, min_snr_db=None, max_ber=None, db_path=None):
     if not Path(db_path).exists():
         return []  # No database yet
 
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row  # Return rows as dicts
-    cursor = conn.cursor()
+    # Shared read-only connection (rows come back as dict-like sqlite3.Row)
+    cursor = _ro_conn(db_path).cursor()
 
     # 🎓 BUILD QUERY
     query = 'SELECT * FROM missions WHERE 1=1'
@@ -249,11 +503,9 @@ def query_missions(limit=100, min_snr_db=None, max_ber=None, db_path=None):
         mission = dict(row)
         # Parse metadata JSON
         if mission['metadata']:
-            mission['metadata'] = json.loads(mission['metadata'])
+            mission['metadata'] = _loads(mission['metadata'])
         missions.append(mission)
 
-    conn.close()
-
     return missions
 
 
@@ -279,9 +531,7 @@ def get_mission_by_id(mission_id, db_path=None):
     if not Path(db_path).exists():
         return None
 
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    cursor = _ro_conn(db_path).cursor()
 
     cursor.execute('SELECT * FROM missions WHERE id = ?', (mission_id,))
     row = cursor.fetchone()
@@ -289,12 +539,10 @@ def get_mission_by_id(mission_id, db_path=None):
     if row:
         mission = dict(row)
         if mission['metadata']:
-            mission['metadata'] = json.loads(mission['metadata'])
+            mission['metadata'] = _loads(mission['metadata'])
     else:
         mission = None
 
-    conn.close()
-
     return mission
 
 
@@ -333,8 +581,7 @@ def get_mission_statistics(db_path=None):
     if not Path(db_path).exists():
         return {'total_missions': 0}
 
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
+    cursor = _ro_conn(db_path).cursor()
 
     # 🎓 AGGREGATE QUERIES
     # COUNT, AVG, SUM are SQL aggregate functions
@@ -363,8 +610,6 @@ def get_mission_statistics(db_path=None):
     else:
         per = 0.0
 
-    conn.close()
-
     return {
         'total_missions': total_missions,
         'average_ber': avg_ber,
@@ -399,13 +644,12 @@ def clear_database(db_path=None):
     if not Path(db_path).exists():
         return 0
 
-    conn = sqlite3.connect(str(db_path))
+    conn = _connect(db_path)
     cursor = conn.cursor()
 
     cursor.execute('DELETE FROM missions')
     rows_deleted = cursor.rowcount
 
-    conn.commit()
     conn.close()
 
     return rows_deleted
@@ -417,6 +661,7 @@ def clear_database(db_path=None):
 #   1. Database locked? Close all connections before new operations
 #   2. File not found? init_database() creates it automatically
 #   3. JSON decode error? Check metadata is valid JSON
+#      (older databases hold it as TEXT, newer ones as BLOB - both load)
 #   4. Query returns nothing? Check filters aren't too restrictive
 #
 # Testing Tips:
@@ -428,6 +673,13 @@ def clear_database(db_path=None):
 # Gotchas:
 #   - SQLite is file-based (not client-server)
 #   - Concurrent writes can cause locking
+#   - Connections are in autocommit mode (isolation_level=None):
+#     use batch_session() when several writes belong together
+#   - init_database() skips files it has already initialized in this
+#     process; it re-runs if the file has been deleted since
+#   - Read functions reuse a cached read-only connection. It is reopened
+#     when init_database() runs or the file's inode changes, so a deleted
+#     and recreated database is picked up automatically
 #   - TEXT type can store large strings
 #   - REAL type is floating-point (not exact decimal)
 
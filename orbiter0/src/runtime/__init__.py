@@ -18,6 +18,12 @@ It's the conductor of our satellite communications orchestra!
 ═══════════════════════════════════════════════════════════════════
 """
 
-from .pipeline import simulate_transmission, simulate_satellite_pass
+from .pipeline import (
+    simulate_transmission, simulate_satellite_pass,
+    precode_message, simulate_transmission_precoded
+)
 
-__all__ = ['simulate_transmission', 'simulate_satellite_pass']
+__all__ = [
+    'simulate_transmission', 'simulate_satellite_pass',
+    'precode_message', 'simulate_transmission_precoded'
+]
@@ -40,7 +40,8 @@ SIMPLIFICATIONS:
   - Simulated delays (not actual I/O)
   - Single satellite (no multi-sat coordination)
   - Simplified event loop
-  - No advanced async patterns (no workers/pools)
+  - No advanced async patterns: one event loop per run, and callbacks
+    run on the caller's thread (see run_async() for the one exception)
 
 ═══════════════════════════════════════════════════════════════════
 """
@@ -61,8 +62,13 @@ SIMPLIFICATIONS:
 # └────────────────────────────────────────────────────────────┘
 
 import asyncio
+import contextlib
+import functools
+import json
 import time
+from collections import deque
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import AsyncGenerator, Dict, List, Optional, Callable
 from pathlib import Path
 import sys
@@ -70,13 +76,82 @@ import sys
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from runtime.pipeline import simulate_transmission
+from runtime.pipeline import (
+    simulate_transmission, precode_message, simulate_transmission_precoded
+)
+
+# 🎓 OPTIONAL FAST EVENT LOOP
+# uvloop is a drop-in replacement for asyncio's event loop, written in
+# Cython on top of libuv (the engine behind Node.js). Timer-heavy code like
+# our "transmit, sleep, transmit" streams wakes up 2-4x cheaper with it.
+# Not installed? We simply use the standard asyncio loop.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def _use_eager_tasks():
+    """
+    Switch the running event loop to the eager task factory (Python 3.12+).
+
+    🎓 TEACHING NOTE:
+    Normally a new task is queued and only starts on the NEXT loop
+    iteration. An "eager" task starts running immediately, and if it
+    finishes without ever awaiting, it never touches the scheduler at
+    all. Quick callbacks (update a counter, print a line) become almost
+    free. On older Pythons this does nothing.
+
+    The loop may belong to the caller, so every simulation hands the
+    return value to _restore_task_factory() when it finishes.
+
+    Returns
+    -------
+    installed : bool
+        True if the eager factory was installed here
+    """
+    eager_factory = getattr(asyncio, 'eager_task_factory', None)
+    if eager_factory is None:
+        return False
+
+    loop = asyncio.get_running_loop()
+    # Don't override a factory someone else installed on purpose
+    if loop.get_task_factory() is not None:
+        return False
+    loop.set_task_factory(eager_factory)
+    return True
+
+
+def _restore_task_factory(installed):
+    """Undo _use_eager_tasks(): put back the loop's default task factory."""
+    if installed:
+        asyncio.get_running_loop().set_task_factory(None)
 
 
 # ═══════════════════════════════════════════════════════════════
 # ASYNC PACKET STREAM GENERATOR
 # ═══════════════════════════════════════════════════════════════
 
+# 🎓 In batch mode (interval <= 0) we never sleep, but still hand control
+# back to the event loop every this-many packets so other tasks can run
+_BATCH_YIELD_EVERY = 32
+
+
+async def _sleep_until(loop, deadline):
+    """
+    Sleep until an ABSOLUTE loop time (skip entirely if already late).
+
+    🎓 TEACHING NOTE:
+    sleep(interval) after every packet adds the packet's compute time to
+    each gap, so a 10-packet pass drifts later and later. Sleeping until
+    t0 + i*interval keeps packet i on schedule no matter how long the
+    work took, and an overrun packet doesn't push the rest back.
+    """
+    delay = deadline - loop.time()
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
 async def packet_stream(
     messages: List[str],
     interval_sec: float = 1.0,
@@ -98,6 +173,9 @@ async def packet_stream(
     for the next call. The "await" keyword lets other code run while
     we're waiting.
 
+    PREFETCH: while you handle packet i (and while we wait out the
+    interval), packet i+1 is already being computed in a worker thread.
+
     Parameters
     ----------
     messages : list of str
@@ -113,34 +191,276 @@ async def packet_stream(
         Transmission result for each packet
     """
 
-    print(f"📡 Starting async packet stream ({len(messages)} packets)...")
-    print(f"   Interval: {interval_sec} sec")
-    print()
+    print(f"📡 Starting async packet stream ({len(messages)} packets)...\n"
+          f"   Interval: {interval_sec} sec\n")
 
-    for i, message in enumerate(messages):
-        print(f"⏱️  Transmitting packet {i+1}/{len(messages)}: \"{message}\"")
+    # The pipeline's step-by-step report stays off unless asked for
+    transmission_params.setdefault('verbose', False)
 
-        # Simulate transmission (runs synchronously but quickly)
-        result = simulate_transmission(
-            message=message,
-            save_to_db=False,  # We'll batch save later
-            **transmission_params
+    loop = asyncio.get_running_loop()
+    t0 = loop.time()
+    # 🎓 ONE wall-clock read: later timestamps = loop clock + this offset
+    wall_offset = time.time() - t0
+
+    def start_transmission(message):
+        # Simulate transmission in a worker thread (returns a future)
+        return loop.run_in_executor(
+            None,
+            functools.partial(simulate_transmission, message=message,
+                              save_to_db=False,  # We'll batch save later
+                              **transmission_params)
         )
 
-        # Add metadata
-        result['packet_number'] = i + 1
-        result['total_packets'] = len(messages)
-        result['timestamp'] = time.time()
+    # 🎓 BATCH MODE: interval <= 0 means "process the backlog at full speed"
+    batch_mode = interval_sec <= 0
+
+    # 🎓 ONE-DEEP PREFETCH
+    # next_future is always the NEXT packet, already computing
+    next_future = start_transmission(messages[0]) if messages else None
 
-        # 🎓 YIELD: Return this packet but keep function alive
-        yield result
+    try:
+        for i, message in enumerate(messages):
+            print(f"⏱️  Transmitting packet {i+1}/{len(messages)}: \"{message}\"")
 
-        # 🎓 AWAIT: Pause without blocking (let other tasks run)
-        if i < len(messages) - 1:  # Don't wait after last packet
-            await asyncio.sleep(interval_sec)
+            result = await next_future
+
+            # Kick off packet i+1 right away - it computes while the
+            # caller handles packet i and while we sleep below
+            if i < len(messages) - 1:
+                next_future = start_transmission(messages[i + 1])
+            else:
+                next_future = None
+
+            # Add metadata
+            result['packet_number'] = i + 1
+            result['total_packets'] = len(messages)
+            result['timestamp'] = wall_offset + loop.time()
+
+            # 🎓 YIELD: Return this packet but keep function alive
+            yield result
+
+            # 🎓 AWAIT: Pause without blocking (let other tasks run)
+            if batch_mode:
+                # Full speed: no timers at all, just stay cooperative
+                if (i + 1) % _BATCH_YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+            elif i < len(messages) - 1:  # Don't wait after last packet
+                await _sleep_until(loop, t0 + (i + 1) * interval_sec)
+    finally:
+        # Caller stopped early? Don't leave a prefetched packet dangling
+        if next_future is not None:
+            next_future.cancel()
+
+    print("\n✅ Packet stream complete!")
+
+
+# ═══════════════════════════════════════════════════════════════
+# BACKGROUND CONSOLE LOGGER
+# ═══════════════════════════════════════════════════════════════
+
+# 🎓 Flush stdout after this many lines (or whenever the queue runs dry)
+_LOG_FLUSH_LINES = 16
+
+
+class _BackgroundLogger:
+    """
+    Queue-fed console logger that runs as its own asyncio task.
+
+    🎓 TEACHING NOTE:
+    print() grabs the stdout lock and may flush - a blocking call right
+    in the middle of our packet loop. Instead, the loop just drops the
+    text into a queue (instant!) and a separate task writes it out.
+    With quiet=True there is no task at all and log() does nothing.
+
+    Usage (inside a coroutine):
+        logger = _BackgroundLogger(quiet)
+        logger.log("hello")
+        await logger.close()   # waits until everything is written
+    """
+
+    def __init__(self, quiet=False):
+        self._queue = None
+        self._task = None
+        if quiet:
+            self.log = self._discard
+        else:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._consume())
+            self.log = self._queue.put_nowait
+
+    @staticmethod
+    def _discard(msg):
+        pass
+
+    async def _consume(self):
+        write = sys.stdout.write
+        pending = 0
+        while True:
+            msg = await self._queue.get()
+            write(msg + '\n')
+            pending += 1
+            if pending >= _LOG_FLUSH_LINES or self._queue.empty():
+                sys.stdout.flush()
+                pending = 0
+            self._queue.task_done()
+
+    async def close(self):
+        """Wait for queued lines to be written, then stop the task."""
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        self._task = None
+
+
+# ═══════════════════════════════════════════════════════════════
+# RESULT SINK (keep in memory OR stream to disk)
+# ═══════════════════════════════════════════════════════════════
+
+# 🎓 When streaming to disk, only this many recent packets stay in memory
+_STREAM_WINDOW = 16
+
+
+def _json_default(obj):
+    """Make NumPy arrays/scalars (and anything else) JSON-friendly."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, bytes):
+        return obj.hex()
+    return str(obj)
+
+
+# 🎓 Big per-packet arrays that the summary doesn't need by default
+_RAW_KEYS = ('transmitted_bits', 'received_bits', 'transmitted_signal',
+             'received_signal', 'time_axis')
+
+
+def _strip_raw(result):
+    """
+    Drop the large bit/signal arrays from a result (in place) and
+    return it.
+
+    🎓 TEACHING NOTE:
+    A packet's signal arrays hold thousands of samples, while its stats
+    are a handful of numbers. Dropping the arrays once we've counted the
+    bits keeps the summary small and cheap to store (e.g. in Streamlit
+    session state). The bit count survives as 'transmitted_bits_len'.
+
+    Callers pass a shallow copy, so a callback that kept the result it
+    was given still sees the full arrays.
+    """
+    bits = result.get('transmitted_bits')
+    if bits is not None:
+        result['transmitted_bits_len'] = len(bits)
+    for key in _RAW_KEYS:
+        result.pop(key, None)
+    return result
+
+
+class _ResultSink:
+    """
+    Collects packet results for a downlink summary.
+
+    🎓 TEACHING NOTE:
+    Every result carries full bit and signal arrays. Keeping thousands of
+    them in a list means memory grows with the length of the pass!
+    With stream_to set, each result is appended to a JSON-lines file
+    (one packet per line) by a worker thread, and only the last
+    _STREAM_WINDOW packets are kept in memory.
+    With keep=False no result dicts are kept at all - the summary's
+    'timeline' arrays already hold the per-packet numbers.
+    """
+
+    def __init__(self, stream_to=None, keep=True):
+        self.stream_to = Path(stream_to) if stream_to is not None else None
+        if not keep:
+            self._packets = None
+        elif self.stream_to is None:
+            self._packets = []
+        else:
+            self._packets = deque(maxlen=_STREAM_WINDOW)
+        self._file = (open(self.stream_to, 'a', encoding='utf-8')
+                      if self.stream_to is not None else None)
+
+    def _write(self, result):
+        self._file.write(json.dumps(result, default=_json_default) + '\n')
+
+    async def add(self, result):
+        if self._packets is not None:
+            self._packets.append(result)
+        if self._file is not None:
+            # Serializing + writing happens off the event loop thread
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write, result
+            )
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def packets(self):
+        return list(self._packets) if self._packets is not None else None
+
+
+# ┌────────────────────────────────────────────────────────────┐
+# │           PRODUCER / CONSUMER DOWNLINK                     │
+# ├────────────────────────────────────────────────────────────┤
+# │                                                            │
+# │  _produce (worker thread)    Queue(2)     consumer (loop)  │
+# │  simulate packet N+1  ──►  [ N ][   ]  ──►  callback(N)    │
+# │         │                                                  │
+# │         └─ computes WHILE the consumer handles packet N    │
+# │            and while we wait out the interval              │
+# │                                                            │
+# └────────────────────────────────────────────────────────────┘
+
+# 🎓 How many finished packets may wait in the queue. Small = the producer
+# never races far ahead of a slow consumer (backpressure)
+_QUEUE_DEPTH = 2
 
-    print()
-    print("✅ Packet stream complete!")
+
+async def _produce(messages, queue, interval_sec, log,
+                   **transmission_params):
+    """
+    Producer half of simulate_live_downlink().
+
+    🎓 TEACHING NOTE:
+    simulate_transmission() is CPU work, so it runs in a worker thread
+    (run_in_executor) and the event loop stays free for the consumer.
+    Packets are still released at most once per interval_sec, but the
+    NEXT packet is computed during that wait instead of after it.
+    Finishes by putting None on the queue ("no more packets").
+    """
+    loop = asyncio.get_running_loop()
+    t0 = loop.time()
+    wall_offset = time.time() - t0
+
+    try:
+        for i, message in enumerate(messages):
+            log(f"⏱️  Transmitting packet {i+1}/{len(messages)}: \"{message}\"")
+
+            result = await loop.run_in_executor(
+                None,
+                functools.partial(simulate_transmission, message=message,
+                                  save_to_db=False, **transmission_params)
+            )
+
+            # 🎓 PACING: hold the packet until its time slot arrives
+            await _sleep_until(loop, t0 + i * interval_sec)
+
+            result['packet_number'] = i + 1
+            result['total_packets'] = len(messages)
+            result['timestamp'] = wall_offset + loop.time()
+
+            # Blocks here if the consumer is more than _QUEUE_DEPTH behind
+            await queue.put(result)
+    finally:
+        # Always tell the consumer to stop - even if a transmission failed
+        await queue.put(None)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -151,6 +471,10 @@ async def simulate_live_downlink(
     messages: List[str],
     interval_sec: float = 1.0,
     on_packet_callback: Optional[Callable] = None,
+    quiet: bool = False,
+    stream_to: Optional[Path] = None,
+    include_raw: bool = False,
+    keep_packets: bool = True,
     **transmission_params
 ) -> Dict:
     """
@@ -171,70 +495,162 @@ async def simulate_live_downlink(
         Time between packets
     on_packet_callback : callable, optional
         Function called with each packet: callback(result)
+    quiet : bool
+        Suppress console output (no background logger task at all)
+    stream_to : str or Path, optional
+        Append every packet result to this JSON-lines file (with
+        keep_packets, summary['packets'] is then only the last few)
+    include_raw : bool
+        Keep each packet's bit and signal arrays in the summary. By
+        default they are dropped after the callback has seen them
+    keep_packets : bool
+        Keep every result dict in summary['packets'] (default). Pass
+        False on long runs to keep only the summary['timeline'] arrays
     **transmission_params
         Parameters for transmission
 
     Returns
     -------
     summary : dict
-        Complete downlink summary with all packets
+        Complete downlink summary. summary['timeline'] holds one NumPy
+        array per field (packet_number, timestamp, ber, snr_actual_db,
+        packet_valid), indexed by packet; summary['packets'] holds the
+        result dicts unless keep_packets=False
     """
 
-    start_time = time.time()
-    results = []
-    total_errors = 0
-    total_bits = 0
-    total_bit_errors = 0
-
-    print("=" * 60)
-    print("🛰️  LIVE DOWNLINK SIMULATION")
-    print("=" * 60)
+    # 🎓 NO PRINTING IN WORKER THREADS
+    # simulate_transmission() prints a step-by-step report by default;
+    # here our own logger reports progress, so it stays silent unless the
+    # caller explicitly passes verbose=True
+    transmission_params.setdefault('verbose', False)
+
+    # 🎓 TIMING USES THE EVENT LOOP'S MONOTONIC CLOCK
+    # loop.time() is the same clock asyncio schedules sleeps with, and it
+    # never jumps if the system clock is adjusted mid-downlink
+    start_time = asyncio.get_running_loop().time()
+    sink = _ResultSink(stream_to, keep=keep_packets)
+
+    # 🎓 PREALLOCATED COUNTERS (STRUCTURE OF ARRAYS)
+    # One slot per packet, filled as packets arrive and summed ONCE at the
+    # end - no running Python additions in the per-packet path. The same
+    # arrays become summary['timeline'], so no per-packet dicts need to
+    # be kept around just to plot BER over time
+    num_messages = len(messages)
+    bits_arr = np.zeros(num_messages, dtype=np.int64)
+    errs_arr = np.zeros(num_messages, dtype=np.int64)
+    valid_arr = np.zeros(num_messages, dtype=bool)
+    ber_arr = np.zeros(num_messages)
+    snr_arr = np.zeros(num_messages)
+    ts_arr = np.zeros(num_messages)
+
+    # Eager tasks for this run only (undone in the finally below)
+    eager_installed = _use_eager_tasks()
+
+    # 🎓 CONSOLE OUTPUT GOES THROUGH A BACKGROUND TASK
+    logger = _BackgroundLogger(quiet)
+    log = logger.log
 
-    # 🎓 ASYNC FOR: Iterate over async generator
-    # As each packet arrives, process it immediately
-    async for result in packet_stream(messages, interval_sec, **transmission_params):
-
-        # Collect statistics
-        results.append(result)
-        total_bits += len(result['transmitted_bits'])
-        total_bit_errors += result['total_bit_errors']
-
-        if not result['packet_valid']:
-            total_errors += 1
+    try:
+        log("\n".join(["=" * 60, "🛰️  LIVE DOWNLINK SIMULATION", "=" * 60]))
 
-        # 🎓 CALLBACK: Notify external code (e.g., UI update)
-        if on_packet_callback:
-            # Callback can be sync or async
-            if asyncio.iscoroutinefunction(on_packet_callback):
-                await on_packet_callback(result)
-            else:
-                on_packet_callback(result)
-
-    elapsed_time = time.time() - start_time
-    overall_ber = total_bit_errors / total_bits if total_bits > 0 else 0
-
-    # Summary
-    summary = {
-        'total_packets': len(messages),
-        'successful_packets': len(messages) - total_errors,
-        'corrupted_packets': total_errors,
-        'overall_ber': overall_ber,
-        'total_bit_errors': total_bit_errors,
-        'total_bits': total_bits,
-        'elapsed_time_sec': elapsed_time,
-        'packets': results
-    }
+        notify = _wrap_callback(on_packet_callback)
 
-    print()
-    print("=" * 60)
-    print("LIVE DOWNLINK COMPLETE!")
-    print("=" * 60)
-    print(f"Packets: {summary['successful_packets']}/{summary['total_packets']} successful")
-    print(f"Overall BER: {overall_ber:.6f}")
-    print(f"Time: {elapsed_time:.2f} seconds")
-    print("=" * 60)
+        # 🎓 START THE PRODUCER
+        # It fills the queue in the background while we consume below
+        queue = asyncio.Queue(maxsize=_QUEUE_DEPTH)
+        producer = asyncio.create_task(
+            _produce(messages, queue, interval_sec, log,
+                     **transmission_params)
+        )
 
-    return summary
+        # 🎓 CONSUME: process each packet as soon as it is released
+        k = 0
+        try:
+            while True:
+                result = await queue.get()
+                if result is None:  # Producer finished (or failed)
+                    break
+
+                # Collect statistics
+                bits = result['transmitted_bits']
+                # .size is a stored attribute on arrays; len() is for plain lists
+                bits_arr[k] = bits.size if isinstance(bits, np.ndarray) else len(bits)
+                errs_arr[k] = result['total_bit_errors']
+                valid_arr[k] = result['packet_valid']
+                ber_arr[k] = result['ber']
+                snr_arr[k] = result['snr_actual_db']
+                ts_arr[k] = result['timestamp']
+
+                # 🎓 CALLBACK: Notify external code (e.g., UI update)
+                # Sync or async, it was wrapped into one async shape up front
+                if notify is not None:
+                    await notify(result)
+
+                # Keep (or stream out) the result - minus raw arrays by default
+                if not include_raw:
+                    result = _strip_raw(dict(result))
+                await sink.add(result)
+                k += 1
+
+            # Re-raises any exception from the producer (e.g. a failed transmission)
+            await producer
+        finally:
+            # 🎓 If the consumer failed (e.g. a callback raised), stop the
+            # producer too - otherwise it keeps transmitting into a queue
+            # nobody reads
+            if not producer.done():
+                producer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await producer
+
+        elapsed_time = asyncio.get_running_loop().time() - start_time
+
+        # 🎓 REDUCE ONCE
+        total_bits = int(bits_arr.sum())
+        total_bit_errors = int(errs_arr.sum())
+        total_errors = num_messages - int(np.count_nonzero(valid_arr))
+        overall_ber = total_bit_errors / total_bits if total_bits > 0 else 0
+
+        # Summary
+        summary = {
+            'total_packets': len(messages),
+            'successful_packets': len(messages) - total_errors,
+            'corrupted_packets': total_errors,
+            'overall_ber': overall_ber,
+            'total_bit_errors': total_bit_errors,
+            'total_bits': total_bits,
+            'elapsed_time_sec': elapsed_time,
+            'timeline': {
+                'packet_number': np.arange(1, num_messages + 1),
+                'timestamp': ts_arr,
+                'ber': ber_arr,
+                'snr_actual_db': snr_arr,
+                'packet_valid': valid_arr,
+            }
+        }
+        if keep_packets:
+            summary['packets'] = sink.packets
+        if sink.stream_to is not None:
+            summary['stream_to'] = str(sink.stream_to)
+
+        # 🎓 ONE MULTI-LINE WRITE instead of one per line
+        log("\n".join([
+            "",
+            "=" * 60,
+            "LIVE DOWNLINK COMPLETE!",
+            "=" * 60,
+            f"Packets: {summary['successful_packets']}/{summary['total_packets']} successful",
+            f"Overall BER: {overall_ber:.6f}",
+            f"Time: {elapsed_time:.2f} seconds",
+            "=" * 60,
+        ]))
+
+        return summary
+    finally:
+        sink.close()
+        # Let every queued line reach the console before we return
+        await logger.close()
+        _restore_task_factory(eager_installed)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -246,6 +662,12 @@ async def simulate_live_satellite_pass(
     pass_duration_sec: float = 300,
     num_transmissions: int = 10,
     on_packet_callback: Optional[Callable] = None,
+    realtime: bool = True,
+    max_workers: Optional[int] = None,
+    quiet: bool = False,
+    stream_to: Optional[Path] = None,
+    include_raw: bool = False,
+    keep_packets: bool = True,
     **transmission_params
 ) -> Dict:
     """
@@ -267,120 +689,322 @@ async def simulate_live_satellite_pass(
         Number of transmissions during pass
     on_packet_callback : callable, optional
         Called with each packet result
+    realtime : bool
+        True (default): pace transmissions across the pass duration.
+        False: offline analytics mode - run every transmission at once
+        in a thread pool, then call the callback for each in order
+    max_workers : int, optional
+        Thread pool size for realtime=False (None = Python's default)
+    quiet : bool
+        Suppress console output (no background logger task at all)
+    stream_to : str or Path, optional
+        Append every packet result to this JSON-lines file (with
+        keep_packets, summary['packets'] is then only the last few)
+    include_raw : bool
+        Keep each packet's bit and signal arrays in the summary. By
+        default they are dropped after the callback has seen them
+    keep_packets : bool
+        Keep every result dict in summary['packets'] (default). Pass
+        False on long runs to keep only the summary['timeline'] arrays
     **transmission_params
         Transmission parameters
 
     Returns
     -------
     summary : dict
-        Complete pass summary
+        Complete pass summary. summary['timeline'] holds one NumPy array
+        per field (packet_number, timestamp, pass_progress, elevation_deg,
+        ber, snr_actual_db, packet_valid), indexed by transmission;
+        summary['packets'] holds the result dicts unless
+        keep_packets=False
     """
 
-    print("=" * 60)
-    print("🛰️  LIVE SATELLITE PASS SIMULATION")
-    print("=" * 60)
+    # Eager tasks for this run only (undone in the finally below)
+    eager_installed = _use_eager_tasks()
+
+    # 🎓 CONSOLE OUTPUT GOES THROUGH A BACKGROUND TASK
+    logger = _BackgroundLogger(quiet)
+    log = logger.log
+    sink = _ResultSink(stream_to, keep=keep_packets)
+
+    try:
+        log("\n".join(["=" * 60, "🛰️  LIVE SATELLITE PASS SIMULATION", "=" * 60]))
+
+        # Pipeline step-by-step report off (see simulate_live_downlink)
+        transmission_params.setdefault('verbose', False)
+
+        # Calculate transmission schedule
+        interval = pass_duration_sec / num_transmissions
+
+        # 🎓 PRECOMPUTE THE WHOLE PASS GEOMETRY AT ONCE
+        # The schedule doesn't depend on any results, so NumPy builds every
+        # transmission's SNR / distance / elevation in one go
+        schedule = _pass_schedule(num_transmissions,
+                                  transmission_params.get('snr_db', 5))
+
+        # 🎓 STREAMING STATISTICS (STRUCTURE OF ARRAYS)
+        # Filled per transmission so the summary never needs the full
+        # result list - these arrays ARE the summary's timeline
+        valid_arr = np.zeros(num_transmissions, dtype=bool)
+        ber_arr = np.zeros(num_transmissions)
+        snr_arr = np.zeros(num_transmissions)
+        ts_arr = np.zeros(num_transmissions)
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        wall_offset = time.time() - start_time
+        notify = _wrap_callback(on_packet_callback)
+
+        # Same message every transmission - encode text → bits only once
+        precoded = precode_message(message)
+
+        if not realtime:
+            # 🎓 OFFLINE MODE: no pacing, run every transmission concurrently
+            batch = await _run_pass_concurrently(
+                precoded, schedule, max_workers, wall_offset,
+                **transmission_params
+            )
+            for i, result in enumerate(batch):
+                valid_arr[i] = result['packet_valid']
+                ber_arr[i] = result['ber']
+                snr_arr[i] = result['snr_actual_db']
+                ts_arr[i] = result['timestamp']
+
+                if notify is not None:
+                    await notify(result)
+
+                if not include_raw:
+                    result = _strip_raw(dict(result))
+                await sink.add(result)
+            del batch
+        else:
+            # 🎓 ONE PARAMS DICT FOR THE WHOLE PASS
+            # Only snr_db and distance_km change between transmissions, so
+            # they're taken out of the shared dict once and passed as
+            # explicit keywords - nothing is copied or mutated per packet
+            base = dict(transmission_params)
+            base.pop('snr_db', None)
+            base.pop('distance_km', None)
+
+            # .tolist() converts to plain Python floats once, up front
+            rows = zip(schedule['progress'].tolist(),
+                       schedule['elevation_deg'].tolist(),
+                       schedule['distance_km'].tolist(),
+                       schedule['snr_db'].tolist())
+
+            t0 = loop.time()
+
+            for i, (progress, elevation_deg, distance_km, current_snr) in enumerate(rows):
+
+                log(f"\n📡 Transmission {i+1}/{num_transmissions}\n"
+                    f"   Progress: {progress*100:.0f}% through pass\n"
+                    f"   Elevation: {elevation_deg:.1f}°\n"
+                    f"   Distance: {distance_km:.0f} km\n"
+                    f"   Dynamic SNR: {current_snr:.1f} dB")
+
+                # Run transmission with dynamic parameters
+                result = simulate_transmission_precoded(
+                    precoded,
+                    save_to_db=False,
+                    snr_db=current_snr,
+                    distance_km=distance_km,
+                    **base
+                )
+
+                _tag_pass_result(result, i, num_transmissions, schedule,
+                                 wall_offset + loop.time())
+                valid_arr[i] = result['packet_valid']
+                ber_arr[i] = result['ber']
+                snr_arr[i] = result['snr_actual_db']
+                ts_arr[i] = result['timestamp']
+
+                # Callback for real-time updates
+                if notify is not None:
+                    await notify(result)
+
+                if not include_raw:
+                    result = _strip_raw(dict(result))
+                await sink.add(result)
+
+                # Wait for the next transmission slot (no drift, no catch-up lag)
+                if interval <= 0:
+                    # Batch mode: no timers, but let other tasks breathe
+                    if (i + 1) % _BATCH_YIELD_EVERY == 0:
+                        await asyncio.sleep(0)
+                elif i < num_transmissions - 1:
+                    await _sleep_until(loop, t0 + (i + 1) * interval)
+
+        elapsed_time = loop.time() - start_time
+
+        # Calculate summary statistics (one NumPy reduction per array)
+        total_errors = num_transmissions - int(np.count_nonzero(valid_arr))
+        avg_ber = float(ber_arr.mean()) if ber_arr.size else 0.0
+        avg_snr = float(snr_arr.mean()) if snr_arr.size else 0.0
+
+        summary = {
+            'pass_duration_sec': pass_duration_sec,
+            'num_transmissions': num_transmissions,
+            'successful_packets': num_transmissions - total_errors,
+            'corrupted_packets': total_errors,
+            'avg_ber': avg_ber,
+            'avg_snr': avg_snr,
+            'elapsed_time_sec': elapsed_time,
+            'timeline': {
+                'packet_number': np.arange(1, num_transmissions + 1),
+                'timestamp': ts_arr,
+                'pass_progress': schedule['progress'],
+                'elevation_deg': schedule['elevation_deg'],
+                'ber': ber_arr,
+                'snr_actual_db': snr_arr,
+                'packet_valid': valid_arr,
+            }
+        }
+        if keep_packets:
+            summary['packets'] = sink.packets
+        if sink.stream_to is not None:
+            summary['stream_to'] = str(sink.stream_to)
+
+        # 🎓 ONE MULTI-LINE WRITE instead of one per line
+        log("\n".join([
+            "",
+            "=" * 60,
+            "SATELLITE PASS COMPLETE!",
+            "=" * 60,
+            f"Transmissions: {summary['successful_packets']}/{num_transmissions} successful",
+            f"Average BER: {avg_ber:.6f}",
+            f"Average SNR: {avg_snr:.1f} dB",
+            f"Time: {elapsed_time:.2f} seconds",
+            "=" * 60,
+        ]))
+
+        return summary
+    finally:
+        sink.close()
+        # Let every queued line reach the console before we return
+        await logger.close()
+        _restore_task_factory(eager_installed)
+
+
+def _pass_schedule(num_transmissions, snr_db):
+    """
+    Precompute the geometry of every transmission in a pass.
+
+    🎓 TEACHING NOTE:
+    SNR follows an inverted parabola that peaks mid-pass:
+        y = -4(x - 0.5)^2 + 1   (x = progress through the pass, 0 to 1)
+    Distance shrinks and elevation rises as the SNR curve climbs.
 
-    # Calculate transmission schedule
-    interval = pass_duration_sec / num_transmissions
+    Returns
+    -------
+    schedule : dict of np.ndarray
+        'progress', 'snr_db', 'distance_km', 'elevation_deg'
+    """
+    if num_transmissions > 1:
+        progress = np.linspace(0.0, 1.0, num_transmissions)
+    else:
+        progress = np.full(num_transmissions, 0.5)
+
+    snr_normalized = 1 - 4 * np.square(progress - 0.5)
+    min_snr = snr_db - 10
+    max_snr = snr_db + 10
+
+    return {
+        'progress': progress,
+        'snr_db': min_snr + snr_normalized * (max_snr - min_snr),
+        # Distance inversely related to SNR (closer = better signal)
+        'distance_km': 2500 - 1000 * snr_normalized,
+        # Elevation angle (0° at horizon, peaks at zenith)
+        'elevation_deg': 90 * snr_normalized,
+    }
 
-    # Create list of messages (same message repeated)
-    messages = [message] * num_transmissions
 
-    # Simulate with varying SNR
-    # SNR follows a parabolic curve (low → high → low)
-    results = []
-    start_time = time.time()
+def _tag_pass_result(result, i, num_transmissions, schedule, timestamp):
+    """Add pass-specific metadata to one transmission result."""
+    result['packet_number'] = i + 1
+    result['total_packets'] = num_transmissions
+    result['pass_progress'] = float(schedule['progress'][i])
+    result['elevation_deg'] = float(schedule['elevation_deg'][i])
+    result['timestamp'] = timestamp
 
-    for i in range(num_transmissions):
-        # Calculate progress through pass (0 to 1)
-        progress = i / (num_transmissions - 1) if num_transmissions > 1 else 0.5
 
-        # SNR follows inverted parabola: peaks at middle of pass
-        # y = -4(x - 0.5)^2 + 1
-        # Normalized to 0-1, then scale to SNR range
-        snr_normalized = 1 - 4 * (progress - 0.5)**2
-        min_snr = transmission_params.get('snr_db', 5) - 10
-        max_snr = transmission_params.get('snr_db', 5) + 10
-        current_snr = min_snr + snr_normalized * (max_snr - min_snr)
+def _wrap_callback(on_packet_callback):
+    """
+    Turn any packet callback into ONE uniform async function (or None).
 
-        # Distance inversely related to SNR (closer = better signal)
-        distance_km = 2500 - 1000 * snr_normalized
+    🎓 TEACHING NOTE:
+    Callbacks may be plain functions or async functions. Rather than
+    asking "which kind is it?" for every packet, we decide once up front:
+      - None           → None (nothing to call)
+      - async function → used as-is
+      - plain function → wrapped in a tiny async adapter
+    The packet loop then just does:  await notify(result)
+    """
+    if on_packet_callback is None:
+        return None
+    if asyncio.iscoroutinefunction(on_packet_callback):
+        return on_packet_callback
 
-        # Elevation angle (0° at horizon, peaks at zenith)
-        elevation_deg = 90 * snr_normalized
-
-        print(f"\n📡 Transmission {i+1}/{num_transmissions}")
-        print(f"   Progress: {progress*100:.0f}% through pass")
-        print(f"   Elevation: {elevation_deg:.1f}°")
-        print(f"   Distance: {distance_km:.0f} km")
-        print(f"   Dynamic SNR: {current_snr:.1f} dB")
-
-        # Run transmission with dynamic parameters
-        params = transmission_params.copy()
-        params['snr_db'] = current_snr
-        params['distance_km'] = distance_km
-
-        result = simulate_transmission(
-            message=message,
-            save_to_db=False,
-            **params
-        )
+    async def notify(result, _callback=on_packet_callback):
+        _callback(result)
 
-        # Add pass-specific metadata
-        result['packet_number'] = i + 1
-        result['total_packets'] = num_transmissions
-        result['pass_progress'] = progress
-        result['elevation_deg'] = elevation_deg
-        result['timestamp'] = time.time()
+    return notify
 
-        results.append(result)
 
-        # Callback for real-time updates
-        if on_packet_callback:
-            if asyncio.iscoroutinefunction(on_packet_callback):
-                await on_packet_callback(result)
-            else:
-                on_packet_callback(result)
-
-        # Wait before next transmission
-        if i < num_transmissions - 1:
-            await asyncio.sleep(interval)
-
-    elapsed_time = time.time() - start_time
-
-    # Calculate summary statistics
-    total_errors = sum(1 for r in results if not r['packet_valid'])
-    avg_ber = np.mean([r['ber'] for r in results])
-    avg_snr = np.mean([r['snr_actual_db'] for r in results])
-
-    summary = {
-        'pass_duration_sec': pass_duration_sec,
-        'num_transmissions': num_transmissions,
-        'successful_packets': num_transmissions - total_errors,
-        'corrupted_packets': total_errors,
-        'avg_ber': avg_ber,
-        'avg_snr': avg_snr,
-        'elapsed_time_sec': elapsed_time,
-        'packets': results
-    }
+async def _run_pass_concurrently(precoded, schedule, max_workers,
+                                 wall_offset, **transmission_params):
+    """
+    Run every transmission of a pass at once in a thread pool.
 
-    print()
-    print("=" * 60)
-    print("SATELLITE PASS COMPLETE!")
-    print("=" * 60)
-    print(f"Transmissions: {summary['successful_packets']}/{num_transmissions} successful")
-    print(f"Average BER: {avg_ber:.6f}")
-    print(f"Average SNR: {avg_snr:.1f} dB")
-    print(f"Time: {elapsed_time:.2f} seconds")
-    print("=" * 60)
+    🎓 TEACHING NOTE:
+    This is the "map" pattern: the same function over many independent
+    inputs. asyncio.gather() waits for all of them and returns results
+    in the SAME ORDER as the tasks, no matter which finished first.
+    """
+    loop = asyncio.get_running_loop()
+    num_transmissions = len(schedule['progress'])
 
-    return summary
+    base = dict(transmission_params)
+    base.pop('snr_db', None)
+    base.pop('distance_km', None)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        tasks = []
+        for snr_db, distance_km in zip(schedule['snr_db'].tolist(),
+                                       schedule['distance_km'].tolist()):
+            tasks.append(loop.run_in_executor(
+                pool,
+                functools.partial(simulate_transmission_precoded, precoded,
+                                  save_to_db=False, snr_db=snr_db,
+                                  distance_km=distance_km, **base)
+            ))
+        results = await asyncio.gather(*tasks)
+
+    # All transmissions finished together - they share one timestamp
+    timestamp = wall_offset + loop.time()
+    for i, result in enumerate(results):
+        _tag_pass_result(result, i, num_transmissions, schedule, timestamp)
+
+    return results
 
 
 # ═══════════════════════════════════════════════════════════════
 # HELPER: RUN ASYNC FUNCTION IN SYNC CONTEXT
 # ═══════════════════════════════════════════════════════════════
 
+# ┌────────────────────────────────────────────────────────────┐
+# │        CALLER'S LOOP BUSY? RUN ON A ONE-OFF THREAD         │
+# ├────────────────────────────────────────────────────────────┤
+# │                                                            │
+# │  No loop running (scripts, Streamlit pages):               │
+# │       asyncio.run() on the CALLER'S thread                 │
+# │                                                            │
+# │  Loop already running (Jupyter):                           │
+# │       worker thread ──► asyncio.run() ──► result           │
+# │       (caller blocks until it's done; thread then exits)   │
+# │                                                            │
+# └────────────────────────────────────────────────────────────┘
+
+
 def run_async(async_func, *args, **kwargs):
     """
     Run an async function from synchronous code.
@@ -394,6 +1018,12 @@ def run_async(async_func, *args, **kwargs):
     - Jupyter notebooks
     - Streamlit apps
 
+    Threading contract: with no event loop running in the calling
+    thread (scripts, Streamlit pages), the coroutine - and any
+    on_packet_callback it calls - runs on the caller's own thread, so
+    st.* calls from callbacks work. Only when a loop is already running
+    (Jupyter) does it run on a short-lived worker thread instead.
+
     Parameters
     ----------
     async_func : async function
@@ -407,21 +1037,29 @@ def run_async(async_func, *args, **kwargs):
         Whatever the async function returns
     """
 
-    # 🎓 TRY TO GET EXISTING EVENT LOOP
+    # 🎓 IS A LOOP ALREADY RUNNING?
     # (Jupyter/Streamlit might already have one running)
+    # get_running_loop() is a single C-level check that raises right away
+    # when there is no loop - unlike the deprecated get_event_loop()
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # Can't use run_until_complete on running loop
-            # Create a new event loop in a thread (advanced)
-            import nest_asyncio
-            nest_asyncio.apply()
-            return loop.run_until_complete(async_func(*args, **kwargs))
+        loop = asyncio.get_running_loop()
     except RuntimeError:
-        pass
+        loop = None
+
+    if loop is not None:
+        # Can't use run_until_complete on a running loop - give the
+        # coroutine a fresh loop on a worker thread and wait for it.
+        # (This blocks the calling thread until the coroutine finishes,
+        # just like calling a normal function would.)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(run_async, async_func, *args,
+                               **kwargs).result()
 
     # 🎓 CREATE NEW EVENT LOOP
-    # This is the simple case for regular Python scripts
+    # This is the simple case for regular Python scripts.
+    # uvloop.run() works exactly like asyncio.run(), just on a faster loop
+    if uvloop is not None:
+        return uvloop.run(async_func(*args, **kwargs))
     return asyncio.run(async_func(*args, **kwargs))
 
 
@@ -493,7 +1131,8 @@ if __name__ == "__main__":
 #
 # Common Issues:
 #   1. "RuntimeError: Event loop is already running"
-#      → Use run_async() helper or nest_asyncio
+#      → Use run_async() helper (it runs the coroutine on a one-off
+#        worker thread with its own loop)
 #   2. "TypeError: object is not iterable"
 #      → Make sure using "async for" not regular "for"
 #   3. Callback not being called
@@ -511,6 +1150,38 @@ if __name__ == "__main__":
 #   - Async doesn't make computation faster
 #   - It makes waiting non-blocking (good for UI)
 #   - For CPU-bound work, consider multiprocessing instead
+#   - run_async() uses uvloop when installed (faster asyncio.sleep
+#     wakeups between packets); only if a loop is ALREADY running
+#     (Jupyter) does the coroutine move to a one-off worker thread
+#   - simulate_live_downlink() computes packet N+1 in a worker thread while
+#     packet N is handled, so wall time is about N * max(compute, interval)
+#     instead of N * (compute + interval)
+#   - simulate_live_satellite_pass(realtime=False) skips pacing and runs
+#     all transmissions concurrently in a thread pool (offline analytics)
+#   - The live simulations log through _BackgroundLogger: the packet loop
+#     only enqueues text and a separate task writes it (quiet=True skips
+#     output entirely)
+#   - Timestamps and elapsed times come from loop.time() (monotonic, no
+#     extra syscall); 'timestamp' is converted back to Unix time with an
+#     offset captured once per simulation
+#   - Summaries drop per-packet bit/signal arrays unless include_raw=True
+#     (callbacks still receive the full result first)
+#   - Long passes: pass stream_to='packets.jsonl' so full results go to
+#     disk (summary['packets'] then holds only the last _STREAM_WINDOW
+#     packets)
+#   - The pass schedule and the end-of-pass statistics are whole-array
+#     NumPy operations (no per-packet Python loop, no JIT compile)
+#   - interval <= 0 is batch mode: no sleeps at all, only an
+#     asyncio.sleep(0) every _BATCH_YIELD_EVERY packets
+#   - Pacing sleeps until absolute slot times (t0 + i*interval), so slow
+#     packets don't accumulate drift over a long pass
+#   - On Python 3.12+ the live simulations install asyncio's eager task
+#     factory, so tasks that finish without awaiting skip the scheduler
+#     (only for the duration of the run - the loop's previous default
+#     factory is restored afterwards)
+#   - Summaries keep per-packet numbers as parallel arrays in
+#     summary['timeline'] (structure of arrays); keep_packets=False skips
+#     the summary['packets'] list of result dicts on long passes
 #
 # ═══════════════════════════════════════════════════════════════
 
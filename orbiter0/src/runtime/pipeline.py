@@ -76,8 +76,12 @@ SIMPLIFICATIONS:
 # IMPORTS
 # ═══════════════════════════════════════════════════════════════
 
+import functools
 import numpy as np
 import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
 from pathlib import Path
 import sys
 
@@ -93,23 +97,171 @@ from signals.generator import generate_sine
 
 # Channel effects
 from channel.noise import add_awgn, calculate_snr_db
-from channel.range_loss import apply_free_space_loss, apply_atmospheric_loss
-from channel.fades import apply_fading_events, FadeEvent
+from channel.range_loss import (
+    free_space_gain, free_space_loss_db, atmospheric_loss_db
+)
+from channel.fades import create_fade_mask, FadeEvent
 
 # Communications
-from comms.packetizer import create_packet, parse_packet, validate_packet
+from comms.packetizer import (
+    create_packet, parse_packet, validate_packet, PAYLOAD_OFFSET
+)
 from comms.decoder import (
     hamming_encode_message, hamming_decode_message,
     add_parity_bit, check_parity_bit
 )
-from comms.cleaner import compute_crc16, verify_crc
-from comms.corruptor import flip_random_bits, add_burst_errors
-from comms.anomalies import log_anomaly, AnomalyDetector
 from comms.storage import save_mission, init_database
 
 # Utilities
-from utils.math_helpers import calculate_ber, count_bit_errors
-from utils.timing import SatellitePass, signal_strength_over_time
+from utils.math_helpers import count_bit_errors, bit_errors_and_ber
+from utils.timing import SatellitePass
+
+
+def _silent(*args, **kwargs):
+    """Stand-in for print() when verbose=False."""
+
+
+@dataclass
+class _TransmissionWorkspace:
+    """
+    Scratch buffers reused by every transmission of a satellite pass.
+
+    🎓 TEACHING NOTE:
+    A pass sends the same message again and again, so every transmission
+    builds signals of exactly the same length. Instead of allocating (and
+    freeing) fresh intermediate arrays each time, the pass allocates them
+    once (on the first transmission) and simulate_transmission() writes
+    into them after that.
+
+    Only INTERMEDIATE arrays live here. The transmitted and received
+    signals are returned in each result, so they must stay separate.
+
+    Attributes
+    ----------
+    channel_buf : ndarray or None
+        Signal after range/atmospheric loss and fades, before noise
+    noise_buf : ndarray or None
+        AWGN samples (see channel.noise.add_awgn scratch=)
+    """
+    channel_buf: Optional[np.ndarray] = None
+    noise_buf: Optional[np.ndarray] = None
+
+    def buffers_for(self, signal):
+        """
+        Return (channel_buf, noise_buf) sized like signal.
+
+        Allocated on first use, and again only if the signal's length or
+        dtype changes.
+        """
+        if (self.channel_buf is None
+                or self.channel_buf.shape != signal.shape
+                or self.channel_buf.dtype != signal.dtype):
+            self.channel_buf = np.empty_like(signal)
+            self.noise_buf = np.empty_like(signal)
+        return self.channel_buf, self.noise_buf
+
+
+# ═══════════════════════════════════════════════════════════════
+# MESSAGE PRE-ENCODING
+# ═══════════════════════════════════════════════════════════════
+
+def precode_message(message):
+    """
+    Encode a text message ONCE for repeated transmissions.
+
+    🎓 TEACHING NOTE:
+    A satellite pass sends the SAME message many times. Converting the
+    text to bytes and bits is identical every time, so we do it once
+    and hand the result to simulate_transmission_precoded().
+
+    Parameters
+    ----------
+    message : str
+        Text message to transmit
+
+    Returns
+    -------
+    precoded : dict
+        {'message': str, 'message_bytes': bytes, 'original_bits': ndarray}
+        Treat it as read-only - it is shared by every transmission.
+    """
+    return {
+        'message': message,
+        'message_bytes': message.encode('utf-8'),
+        'original_bits': text_to_bits(message)
+    }
+
+
+def _build_transmit_frame(message_bytes, use_fec, carrier_freq_hz,
+                          sample_rate_hz, say=_silent):
+    """
+    Build everything the transmitter sends: packet, FEC bits, BPSK signal.
+
+    🎓 TEACHING NOTE:
+    Steps 3-5 of simulate_transmission() only depend on the message and
+    the radio settings - not on distance or SNR. A satellite pass
+    repeats the same packet many times, so it builds this frame ONCE
+    (see _build_specialized_transmit) and every transmission only runs
+    the channel and receiver steps.
+
+    Returns
+    -------
+    frame : dict
+        'packet', 'packet_bits', 'bits_to_transmit', 'modulated_signal',
+        'time_axis' (read-only)
+    """
+    # ═══════════════════════════════════════════════════════════
+    # STEP 3: PACKETIZATION
+    # ═══════════════════════════════════════════════════════════
+
+    say("📦 Creating packet...")
+    packet_id = int(time.time() * 1000) % 65536  # Unique ID
+    packet = create_packet(message_bytes, packet_id=packet_id)
+    say(f"   Payload: {len(message_bytes)} bytes")
+    say(f"   Total packet: {len(packet)} bytes (includes header + CRC)")
+
+    # ═══════════════════════════════════════════════════════════
+    # STEP 4: ERROR CORRECTION ENCODING
+    # ═══════════════════════════════════════════════════════════
+
+    # 🎓 BYTES → BITS IN ONE NUMPY CALL
+    # np.unpackbits expands every byte into its 8 bits (MSB first) in C,
+    # instead of format(byte, '08b') + int() for every single bit
+    packet_bits = np.unpackbits(np.frombuffer(packet, dtype=np.uint8))
+
+    if use_fec:
+        say("🛡️  Applying Forward Error Correction...")
+        encoded_bits = hamming_encode_message(packet_bits)
+        say(f"   {len(packet_bits)} bits → {len(encoded_bits)} bits")
+        say(f"   Overhead: {len(encoded_bits) - len(packet_bits)} bits ({100*(len(encoded_bits)/len(packet_bits)-1):.1f}%)")
+
+        bits_to_transmit = encoded_bits
+    else:
+        # No FEC - transmit the packet bits as they are
+        bits_to_transmit = packet_bits
+
+    # ═══════════════════════════════════════════════════════════
+    # STEP 5: BPSK MODULATION
+    # ═══════════════════════════════════════════════════════════
+
+    say("📻 Modulating to BPSK...")
+    symbols = bits_to_bpsk_symbols(bits_to_transmit)
+
+    # Generate carrier and modulate
+    # (modulate_bpsk picks the samples per symbol from the carrier and
+    # sample rate)
+    modulated_signal, time_axis = modulate_bpsk(
+        symbols, carrier_freq_hz, sample_rate_hz
+    )
+    say(f"   {len(symbols)} symbols → {len(modulated_signal)} samples")
+
+    return {
+        'packet': packet,
+        'packet_bits': packet_bits,
+        'bits_to_transmit': bits_to_transmit,
+        'modulated_signal': modulated_signal,
+        'time_axis': time_axis,
+    }
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -124,7 +276,13 @@ def simulate_transmission(
     fading_events=None,
     carrier_freq_hz=1000,
     sample_rate_hz=10000,
-    save_to_db=True
+    save_to_db=True,
+    precoded=None,
+    workspace=None,
+    verbose=True,
+    db_conn=None,
+    return_signals=True,
+    frame=None
 ):
     """
     Run complete satellite transmission simulation.
@@ -154,6 +312,29 @@ def simulate_transmission(
         Sampling rate
     save_to_db : bool
         Whether to save mission to database
+    precoded : dict, optional
+        Output of precode_message(message) - skips re-encoding the text
+    workspace : _TransmissionWorkspace, optional
+        Reusable scratch buffers for the channel stage; used only when
+        they match this transmission's signal length and dtype
+    verbose : bool
+        Print the step-by-step progress report (False = silent, for
+        batch runs and worker processes). When silent, no text is
+        written to stdout at all - the console is often the slowest part
+        of a loop that runs many transmissions
+    db_conn : sqlite3.Connection, optional
+        Connection from comms.storage.batch_session(). With save_to_db,
+        the mission joins that session's single transaction instead of
+        committing on its own
+    return_signals : bool
+        Include the sample arrays ('transmitted_signal',
+        'received_signal', 'time_axis') in the result. False sets them to
+        None - they are by far the largest part of a result, and runs
+        that keep many results (a satellite pass) rarely need them
+    frame : dict, optional
+        Output of _build_transmit_frame() for this message and these
+        use_fec/carrier/sample-rate settings - skips steps 3-5 (the
+        packet is then sent with the frame's packet ID)
 
     Returns
     -------
@@ -164,137 +345,122 @@ def simulate_transmission(
         - ber: bit error rate
         - packet_errors: number of corrupted packets
         - metrics: detailed statistics
-        - anomalies: list of detected issues
+        - anomalies: list of detected issues (short text notes)
     """
 
     # ═══════════════════════════════════════════════════════════
     # STEP 1: INITIALIZATION
     # ═══════════════════════════════════════════════════════════
 
-    print("📡 ORBITER-0 Mission Starting...")
-    print(f"   Message: \"{message}\"")
-    print(f"   Distance: {distance_km} km")
-    print(f"   Target SNR: {snr_db} dB")
-    print(f"   FEC: {'Enabled' if use_fec else 'Disabled'}")
-    print()
+    say = print if verbose else _silent
+
+    say("📡 ORBITER-0 Mission Starting...")
+    say(f"   Message: \"{message}\"")
+    say(f"   Distance: {distance_km} km")
+    say(f"   Target SNR: {snr_db} dB")
+    say(f"   FEC: {'Enabled' if use_fec else 'Disabled'}")
+    say()
 
     start_time = time.time()
-    anomaly_detector = AnomalyDetector()
+    anomalies = []  # Human-readable notes on anything that went wrong
 
-    # Initialize database if saving
-    if save_to_db:
+    # Initialize database if saving (a no-op after the first call, and
+    # not needed at all inside a batch_session)
+    if save_to_db and db_conn is None:
         init_database()
 
     # ═══════════════════════════════════════════════════════════
     # STEP 2: TEXT → BITS
     # ═══════════════════════════════════════════════════════════
 
-    print("🔢 Converting text to bits...")
-    message_bytes = message.encode('utf-8')
-    original_bits = text_to_bits(message)
-    print(f"   {len(message_bytes)} bytes → {len(original_bits)} bits")
-
-    # ═══════════════════════════════════════════════════════════
-    # STEP 3: PACKETIZATION
-    # ═══════════════════════════════════════════════════════════
-
-    print("📦 Creating packet...")
-    packet_id = int(time.time() * 1000) % 65536  # Unique ID
-    packet = create_packet(message_bytes, packet_id=packet_id)
-    print(f"   Payload: {len(message_bytes)} bytes")
-    print(f"   Total packet: {len(packet)} bytes (includes header + CRC)")
+    say("🔢 Converting text to bits...")
+    if precoded is None:
+        precoded = precode_message(message)
+    message_bytes = precoded['message_bytes']
+    original_bits = precoded['original_bits']
+    say(f"   {len(message_bytes)} bytes → {len(original_bits)} bits")
 
     # ═══════════════════════════════════════════════════════════
-    # STEP 4: ERROR CORRECTION ENCODING
+    # STEPS 3-5: PACKET → FEC → BPSK (see _build_transmit_frame)
     # ═══════════════════════════════════════════════════════════
 
-    if use_fec:
-        print("🛡️  Applying Forward Error Correction...")
-        packet_bits = []
-        for byte in packet:
-            packet_bits.extend([int(b) for b in format(byte, '08b')])
-
-        encoded_bits = hamming_encode_message(packet_bits)
-        print(f"   {len(packet_bits)} bits → {len(encoded_bits)} bits")
-        print(f"   Overhead: {len(encoded_bits) - len(packet_bits)} bits ({100*(len(encoded_bits)/len(packet_bits)-1):.1f}%)")
-
-        bits_to_transmit = encoded_bits
+    if frame is None:
+        frame = _build_transmit_frame(message_bytes, use_fec,
+                                      carrier_freq_hz, sample_rate_hz, say)
     else:
-        # No FEC - just convert packet to bits
-        packet_bits = []
-        for byte in packet:
-            packet_bits.extend([int(b) for b in format(byte, '08b')])
-        bits_to_transmit = packet_bits
-
-    # ═══════════════════════════════════════════════════════════
-    # STEP 5: BPSK MODULATION
-    # ═══════════════════════════════════════════════════════════
-
-    print("📻 Modulating to BPSK...")
-    symbols = bits_to_bpsk_symbols(bits_to_transmit)
-
-    # Generate carrier and modulate
-    samples_per_symbol = int(sample_rate_hz / 100)  # 100 symbols/sec
-    modulated_signal, time_axis = modulate_bpsk(
-        symbols, carrier_freq_hz, sample_rate_hz, samples_per_symbol
-    )
-    print(f"   {len(symbols)} symbols → {len(modulated_signal)} samples")
+        say("📻 Reusing prepared packet and BPSK signal...")
+    packet_bits = frame['packet_bits']
+    bits_to_transmit = frame['bits_to_transmit']
+    modulated_signal = frame['modulated_signal']
+    time_axis = frame['time_axis']
 
     # ═══════════════════════════════════════════════════════════
     # STEP 6: CHANNEL EFFECTS
     # ═══════════════════════════════════════════════════════════
 
-    print("🌍 Applying channel effects...")
+    say("🌍 Applying channel effects...")
+
+    # 🎓 ONE PASS OVER THE SIGNAL
+    # Range and atmospheric loss are the same for every sample, so they are
+    # computed as plain numbers and applied together in a single multiply
+    # (instead of one full-length intermediate array per effect)
 
     # 6a. Range loss (free space path loss)
-    signal_after_range = apply_free_space_loss(
-        modulated_signal, distance_km, carrier_freq_hz
-    )
-    range_loss_db = -10 * np.log10(np.mean(signal_after_range**2) / np.mean(modulated_signal**2))
-    print(f"   Range loss: -{range_loss_db:.1f} dB")
+    range_gain = free_space_gain(distance_km)
+    range_loss_db = free_space_loss_db(distance_km)
+    say(f"   Range loss: -{range_loss_db:.1f} dB")
 
     # 6b. Atmospheric absorption
-    signal_after_atmo = apply_atmospheric_loss(signal_after_range, carrier_freq_hz)
-    atmo_loss_db = -10 * np.log10(np.mean(signal_after_atmo**2) / np.mean(signal_after_range**2))
-    print(f"   Atmospheric loss: -{atmo_loss_db:.1f} dB")
+    atmo_loss_db = atmospheric_loss_db()
+    atmo_gain = 10 ** (-atmo_loss_db / 20)
+    say(f"   Atmospheric loss: -{atmo_loss_db:.1f} dB")
+
+    # Write into the pass's reusable buffers when we have them
+    # (np.multiply with out=None simply allocates a new array)
+    if workspace is not None:
+        channel_buf, noise_buf = workspace.buffers_for(modulated_signal)
+    else:
+        channel_buf = noise_buf = None
+    channel_signal = np.multiply(modulated_signal, range_gain * atmo_gain,
+                                 out=channel_buf)
 
-    # 6c. Fading events
+    # 6c. Fading events (time-varying, applied in place)
     if fading_events:
-        print(f"   Applying {len(fading_events)} fade events...")
-        signal_after_fades = apply_fading_events(
-            signal_after_atmo, fading_events, sample_rate_hz, time_axis
-        )
-    else:
-        signal_after_fades = signal_after_atmo
+        say(f"   Applying {len(fading_events)} fade events...")
+        channel_signal *= create_fade_mask(time_axis, fading_events)
 
     # 6d. Additive White Gaussian Noise (AWGN)
-    received_signal = add_awgn(signal_after_fades, snr_db)
-    actual_snr = calculate_snr_db(modulated_signal, received_signal - signal_after_fades)
-    print(f"   AWGN added: SNR = {actual_snr:.1f} dB")
+    received_signal, noise = add_awgn(channel_signal, snr_db,
+                                      scratch=noise_buf)
+    # Measured against channel_signal - the attenuated signal the noise
+    # was actually added to (not the transmitter's full-power signal)
+    actual_snr = calculate_snr_db(channel_signal, noise)
+    say(f"   AWGN added: SNR = {actual_snr:.1f} dB")
 
     # ═══════════════════════════════════════════════════════════
     # STEP 7: DEMODULATION
     # ═══════════════════════════════════════════════════════════
 
-    print("🔊 Demodulating BPSK...")
+    say("🔊 Demodulating BPSK...")
     received_symbols = demodulate_bpsk(
-        received_signal, carrier_freq_hz, sample_rate_hz, samples_per_symbol
+        received_signal, carrier_freq_hz, sample_rate_hz,
+        len(bits_to_transmit)
     )
     received_bits_raw = bpsk_symbols_to_bits(received_symbols)
 
     # Ensure correct length
     received_bits_raw = received_bits_raw[:len(bits_to_transmit)]
-    print(f"   Recovered {len(received_bits_raw)} bits")
+    say(f"   Recovered {len(received_bits_raw)} bits")
 
     # ═══════════════════════════════════════════════════════════
     # STEP 8: ERROR CORRECTION DECODING
     # ═══════════════════════════════════════════════════════════
 
     if use_fec:
-        print("🔧 Applying FEC decoding...")
+        say("🔧 Applying FEC decoding...")
         corrected_bits = hamming_decode_message(received_bits_raw)
         errors_corrected = count_bit_errors(packet_bits, corrected_bits)
-        print(f"   Errors corrected by FEC: {errors_corrected}")
+        say(f"   Errors corrected by FEC: {errors_corrected}")
 
         received_packet_bits = corrected_bits
     else:
@@ -304,30 +470,26 @@ def simulate_transmission(
     # STEP 9: BITS → BYTES (reconstruct packet)
     # ═══════════════════════════════════════════════════════════
 
-    # Convert bits back to bytes
-    received_packet = bytearray()
-    for i in range(0, len(received_packet_bits), 8):
-        if i + 8 <= len(received_packet_bits):
-            byte_bits = received_packet_bits[i:i+8]
-            byte_val = int(''.join(map(str, byte_bits)), 2)
-            received_packet.append(byte_val)
-
-    received_packet = bytes(received_packet)
+    # Convert bits back to bytes (np.packbits is the inverse of unpackbits).
+    # A trailing partial byte is dropped, as before
+    received_packet_bits = np.asarray(received_packet_bits, dtype=np.uint8)
+    whole_bytes = len(received_packet_bits) // 8
+    received_packet = np.packbits(received_packet_bits[:whole_bytes * 8]).tobytes()
 
     # ═══════════════════════════════════════════════════════════
     # STEP 10: PACKET VALIDATION
     # ═══════════════════════════════════════════════════════════
 
-    print("✅ Validating packet...")
+    say("✅ Validating packet...")
     packet_valid = validate_packet(received_packet)
 
     if packet_valid:
-        print("   ✓ CRC check passed!")
+        say("   ✓ CRC check passed!")
         parsed = parse_packet(received_packet)
         received_message = parsed['payload'].decode('utf-8', errors='replace')
         packet_corrupted = False
     else:
-        print("   ✗ CRC check failed - packet corrupted")
+        say("   ✗ CRC check failed - packet corrupted")
         # Try to extract payload anyway for analysis
         try:
             parsed = parse_packet(received_packet)
@@ -335,28 +497,35 @@ def simulate_transmission(
         except:
             received_message = "[UNRECOVERABLE]"
         packet_corrupted = True
-        anomaly_detector.add_anomaly("CRC validation failed", time.time())
+        anomalies.append("CRC validation failed")
 
     # ═══════════════════════════════════════════════════════════
     # STEP 11: CALCULATE METRICS
     # ═══════════════════════════════════════════════════════════
 
-    print("📊 Calculating metrics...")
-    ber = calculate_ber(original_bits, received_bits_raw[:len(original_bits)])
-    total_errors = count_bit_errors(original_bits, received_bits_raw[:len(original_bits)])
+    say("📊 Calculating metrics...")
+    # 🎓 BER counts errors in the MESSAGE the user sees: the payload bytes
+    # of the received packet (after FEC correction) against the bytes we
+    # sent. One XOR + popcount over packed bytes gives both numbers - the
+    # message bytes ARE the original bits, already packed
+    received_payload = received_packet[PAYLOAD_OFFSET:
+                                       PAYLOAD_OFFSET + len(message_bytes)]
+    total_errors, ber = bit_errors_and_ber(
+        message_bytes, received_payload, len(original_bits)
+    )
 
-    print(f"   Bit errors: {total_errors}/{len(original_bits)}")
-    print(f"   BER: {ber:.6f} ({ber*100:.3f}%)")
+    say(f"   Bit errors: {total_errors}/{len(original_bits)}")
+    say(f"   BER: {ber:.6f} ({ber*100:.3f}%)")
 
     # ═══════════════════════════════════════════════════════════
     # STEP 12: ANOMALY DETECTION
     # ═══════════════════════════════════════════════════════════
 
     if ber > 0.1:
-        anomaly_detector.add_anomaly(f"High BER: {ber:.3f}", time.time())
+        anomalies.append(f"High BER: {ber:.3f}")
 
     if actual_snr < 5:
-        anomaly_detector.add_anomaly(f"Low SNR: {actual_snr:.1f} dB", time.time())
+        anomalies.append(f"Low SNR: {actual_snr:.1f} dB")
 
     # ═══════════════════════════════════════════════════════════
     # STEP 13: MISSION ARCHIVAL
@@ -365,7 +534,7 @@ def simulate_transmission(
     elapsed_time = time.time() - start_time
 
     if save_to_db:
-        print("💾 Saving mission to database...")
+        say("💾 Saving mission to database...")
         metadata = {
             'distance_km': distance_km,
             'snr_db': snr_db,
@@ -384,23 +553,24 @@ def simulate_transmission(
             snr_db=actual_snr,
             packets_total=1,
             packets_corrupted=1 if packet_corrupted else 0,
-            metadata=metadata
+            metadata=metadata,
+            conn=db_conn
         )
-        print(f"   Saved as mission #{mission_id}")
+        say(f"   Saved as mission #{mission_id}")
 
     # ═══════════════════════════════════════════════════════════
     # STEP 14: RESULTS PACKAGE
     # ═══════════════════════════════════════════════════════════
 
-    print()
-    print("=" * 60)
-    print("MISSION COMPLETE!")
-    print("=" * 60)
-    print(f"Sent:     \"{message}\"")
-    print(f"Received: \"{received_message}\"")
-    print(f"Match:    {message == received_message}")
-    print(f"Time:     {elapsed_time:.3f} seconds")
-    print("=" * 60)
+    say()
+    say("=" * 60)
+    say("MISSION COMPLETE!")
+    say("=" * 60)
+    say(f"Sent:     \"{message}\"")
+    say(f"Received: \"{received_message}\"")
+    say(f"Match:    {message == received_message}")
+    say(f"Time:     {elapsed_time:.3f} seconds")
+    say("=" * 60)
 
     result = {
         # Messages
@@ -411,9 +581,10 @@ def simulate_transmission(
         # Bits and signals
         'transmitted_bits': bits_to_transmit,
         'received_bits': received_bits_raw,
-        'transmitted_signal': modulated_signal,
-        'received_signal': received_signal,
-        'time_axis': time_axis,
+        # (None unless return_signals - see the parameter above)
+        'transmitted_signal': modulated_signal if return_signals else None,
+        'received_signal': received_signal if return_signals else None,
+        'time_axis': time_axis if return_signals else None,
 
         # Metrics
         'ber': ber,
@@ -429,7 +600,7 @@ def simulate_transmission(
         'packets_corrupted': 1 if packet_corrupted else 0,
 
         # Anomalies
-        'anomalies': anomaly_detector.get_all_anomalies(),
+        'anomalies': anomalies,
 
         # Timing
         'elapsed_time_sec': elapsed_time,
@@ -447,6 +618,58 @@ def simulate_transmission(
     return result
 
 
+def _build_specialized_transmit(precoded, use_fec, carrier_freq_hz=1000,
+                                sample_rate_hz=10000):
+    """
+    Specialize simulate_transmission() for one message and radio setup.
+
+    🎓 TEACHING NOTE:
+    Everything that is the same for every transmission of a pass - the
+    encoded text, the packet, the FEC bits and the modulated signal -
+    is computed here once and captured. The returned function only
+    needs what changes: distance_km and snr_db (plus optional keywords
+    such as workspace= or return_signals=).
+
+    Returns
+    -------
+    transmit : callable
+        transmit(distance_km=..., snr_db=..., **params) → result dict
+    """
+    frame = _build_transmit_frame(precoded['message_bytes'], use_fec,
+                                  carrier_freq_hz, sample_rate_hz)
+    # Shared by every transmission's result - nobody may modify it
+    frame['modulated_signal'].flags.writeable = False
+    return functools.partial(
+        simulate_transmission_precoded, precoded,
+        use_fec=use_fec,
+        carrier_freq_hz=carrier_freq_hz,
+        sample_rate_hz=sample_rate_hz,
+        frame=frame,
+        save_to_db=False,
+        verbose=False
+    )
+
+
+def simulate_transmission_precoded(precoded, **params):
+    """
+    Run simulate_transmission() on a message from precode_message().
+
+    Parameters
+    ----------
+    precoded : dict
+        Output of precode_message()
+    **params
+        Any other simulate_transmission() arguments
+
+    Returns
+    -------
+    result : dict
+        Same as simulate_transmission()
+    """
+    return simulate_transmission(precoded['message'], precoded=precoded,
+                                 **params)
+
+
 # ═══════════════════════════════════════════════════════════════
 # SATELLITE PASS SIMULATION
 # ═══════════════════════════════════════════════════════════════
@@ -458,7 +681,9 @@ def simulate_satellite_pass(
     min_snr_db=5,
     max_snr_db=20,
     use_fec=True,
-    num_transmissions=10
+    num_transmissions=10,
+    processes=1,
+    return_signals=False
 ):
     """
     Simulate complete satellite pass with varying signal strength.
@@ -488,6 +713,15 @@ def simulate_satellite_pass(
         Whether to use error correction
     num_transmissions : int
         Number of transmissions during pass
+    processes : int or None
+        1 (default): run transmissions one after another.
+        N > 1: spread them over N worker processes (None = one per CPU).
+        Transmissions are independent, so the results are the same -
+        just computed in parallel
+    return_signals : bool
+        Keep each transmission's sample arrays (see simulate_transmission).
+        Off by default: memory then stays flat however long the pass is,
+        and parallel workers don't have to send the arrays back
 
     Returns
     -------
@@ -500,13 +734,17 @@ def simulate_satellite_pass(
 
     # Create satellite pass model
     sat_pass = SatellitePass(
-        duration_sec=pass_duration_sec,
+        start_time=0.0,
+        duration=pass_duration_sec,
         max_elevation_deg=max_elevation_deg
     )
 
     # Generate timestamps for transmissions
     transmission_times = np.linspace(0, pass_duration_sec, num_transmissions)
 
+    # Same message every time - encode it once
+    precoded = precode_message(message)
+
     results = {
         'pass_info': {
             'duration_sec': pass_duration_sec,
@@ -522,33 +760,63 @@ def simulate_satellite_pass(
         }
     }
 
-    # Run transmission at each time point
-    for i, t in enumerate(transmission_times):
-        elevation = sat_pass.elevation_at_time(t)
-
-        # SNR varies with elevation (higher = better signal)
-        # Simple model: SNR scales linearly with elevation
-        snr_db = min_snr_db + (max_snr_db - min_snr_db) * (elevation / max_elevation_deg)
-
-        # Distance varies with elevation (higher = closer)
-        # Simple model: distance decreases as satellite rises
-        distance_km = 2000 - 1000 * (elevation / max_elevation_deg)
-
-        print(f"\n📡 Transmission {i+1}/{num_transmissions}")
-        print(f"   Time: {t:.1f} sec into pass")
-        print(f"   Elevation: {elevation:.1f}°")
-        print(f"   Distance: {distance_km:.0f} km")
-
-        # Run transmission
-        tx_result = simulate_transmission(
-            message=message,
-            distance_km=distance_km,
-            snr_db=snr_db,
-            use_fec=use_fec,
-            save_to_db=False  # Don't save individual transmissions
-        )
-
-        # Store results
+    # 🎓 PASS GEOMETRY FOR EVERY TRANSMISSION AT ONCE
+    # Whole-array NumPy math; the loop below only reads the results.
+    # .tolist() turns them into plain Python floats for the pipeline
+    elevation_deg = sat_pass.elevation_at_times(transmission_times)
+    elevation_frac = elevation_deg / max_elevation_deg
+
+    # SNR varies with elevation (higher = better signal)
+    # Simple model: SNR scales linearly with elevation
+    snrs_db = (min_snr_db + (max_snr_db - min_snr_db) * elevation_frac).tolist()
+
+    # Distance varies with elevation (higher = closer)
+    # Simple model: distance decreases as satellite rises
+    distances_km = (2000 - 1000 * elevation_frac).tolist()
+
+    elevations = elevation_deg.tolist()
+
+    if processes == 1:
+        # 🎓 One set of scratch buffers for the whole pass (every transmission
+        # sends the same message, so every signal has the same length).
+        # Allocated during the first transmission
+        workspace = _TransmissionWorkspace()
+
+        # 🎓 Packet, FEC and modulation are built once for the whole pass
+        transmit = _build_specialized_transmit(precoded, use_fec)
+        tx_results = []
+
+        # Run transmission at each time point
+        for i, t in enumerate(transmission_times):
+            print(f"\n📡 Transmission {i+1}/{num_transmissions}")
+            print(f"   Time: {t:.1f} sec into pass")
+            print(f"   Elevation: {elevations[i]:.1f}°")
+            print(f"   Distance: {distances_km[i]:.0f} km")
+
+            # Run transmission
+            # (silent, and not saved - the pass prints and saves its summary)
+            tx_result = transmit(
+                distance_km=distances_km[i],
+                snr_db=snrs_db[i],
+                workspace=workspace,
+                return_signals=return_signals
+            )
+            tx_results.append(tx_result)
+    else:
+        # 🎓 PARALLEL PASS
+        # Transmissions share no state, so each one can run in its own
+        # process (its own CPU core). pool.map returns results in order.
+        print(f"\n📡 Running {num_transmissions} transmissions in parallel...")
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            tx_results = list(pool.map(
+                _run_pass_transmission,
+                [precoded] * num_transmissions, distances_km, snrs_db,
+                [use_fec] * num_transmissions,
+                [return_signals] * num_transmissions
+            ))
+
+    # Store results
+    for elevation, tx_result in zip(elevations, tx_results):
         results['transmissions'].append(tx_result)
         results['timeline']['elevations'].append(elevation)
         results['timeline']['snrs'].append(tx_result['snr_actual_db'])
@@ -586,6 +854,25 @@ def simulate_satellite_pass(
     return results
 
 
+def _run_pass_transmission(precoded, distance_km, snr_db, use_fec,
+                           return_signals):
+    """
+    One silent pass transmission (worker-process entry point).
+
+    Must be a top-level function: ProcessPoolExecutor pickles it by
+    name to send it to the worker processes.
+    """
+    return simulate_transmission_precoded(
+        precoded,
+        distance_km=distance_km,
+        snr_db=snr_db,
+        use_fec=use_fec,
+        save_to_db=False,
+        verbose=False,
+        return_signals=return_signals
+    )
+
+
 # ═══════════════════════════════════════════════════════════════
 # DEBUGGING NOTES
 # ═══════════════════════════════════════════════════════════════
@@ -606,6 +893,23 @@ def simulate_satellite_pass(
 #   - Current implementation prioritizes clarity over speed
 #   - For long messages, consider batching or streaming
 #   - Signal arrays can get large - watch memory usage
+#   - Repeated transmissions of one message should use precode_message()
+#     + simulate_transmission_precoded() to skip re-encoding the text
+#   - Batch callers (satellite pass, async downlink) run transmissions with
+#     verbose=False: no per-step console output inside the loop
+#   - simulate_satellite_pass(processes=None) runs transmissions on every
+#     CPU core; results are pickled back to the parent, so for tiny
+#     messages the serial default can be faster
+#   - Pass results leave out the per-transmission signal arrays unless
+#     return_signals=True (N transmissions x 3 arrays adds up quickly)
+#   - BER is counted on packed bytes (XOR + popcount, 8 bits per op) with
+#     utils.math_helpers.bit_errors_and_ber
+#   - The serial pass builds the packet, FEC bits and BPSK signal once
+#     (_build_specialized_transmit); each transmission then only runs the
+#     channel and receiver steps. All its transmissions share one packet ID
+#   - The serial pass reuses one _TransmissionWorkspace (channel + noise
+#     buffers) for every transmission; only the returned signals are
+#     allocated per transmission
 #
 # ═══════════════════════════════════════════════════════════════
 
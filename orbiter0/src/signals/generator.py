@@ -39,11 +39,90 @@ SIMPLIFICATIONS:
 # │  Output: numpy array of time-domain samples    │
 # └─────────────────────────────────────────────────┘
 
+import functools
+import math
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+# 🎓 OPTIONAL JIT COMPILER
+# Numba compiles the sine recurrence loop below to machine code. Without
+# it, generate_sine() simply uses np.sin for every sample.
+# Each kernel compiles on its first call, so pages that never use them
+# don't pay for it.
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        # No-op stand-in so the @njit(...) decorators below still work
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Output dtypes the kernels handle; anything else (e.g. float16) takes
+# the NumPy path
+_KERNEL_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+# Below this many samples np.sin is already fast - not worth the kernel
+_RECURRENCE_MIN_SAMPLES = 4096
+
+# The recurrence restarts from exact sin() values every this many samples
+_RECURRENCE_BLOCK = 1024
 
-def generate_sine(frequency_hz, amplitude, duration_sec, sample_rate_hz):
+# NumPy's SIMD float32 sin only handles angles up to about this size
+# (radians); bigger ones drop to a much slower one-at-a-time path
+_SIN_FAST_RANGE_F32 = 71476.0
+
+# Samples per float64 slice in the float32 phase reduction (128 KB of
+# scratch instead of a float64 copy of the whole signal)
+_PHASE_CHUNK = 16384
+
+
+@functools.lru_cache(maxsize=16)
+def generate_time_axis(duration_sec, sample_rate_hz, dtype=np.float64):
+    """
+    Create (or reuse) the time axis for a signal.
+
+    🎓 TEACHING NOTE:
+    Every waveform with the same duration and sample rate lives on the
+    SAME time axis. We build it once and hand out the same array, so a
+    sine and a square at the same settings don't each rebuild it.
+
+    Parameters
+    ----------
+    duration_sec : float
+        How long the signal lasts
+    sample_rate_hz : int
+        Samples per second
+    dtype : numpy dtype
+        Sample type of the time values (default float64, so even late
+        samples of a long signal keep their exact time)
+
+    Returns
+    -------
+    time_axis : ndarray of dtype
+        Time values 0, dt, 2·dt, ... with dt = 1/sample_rate_hz
+        (read-only - it is shared between callers)
+    """
+    num_samples = int(duration_sec * sample_rate_hz)
+
+    # 🎓 Sample n is taken at exactly n × dt, where dt = 1 / sample_rate.
+    # (np.linspace(0, duration, n) would stretch the spacing slightly to
+    # land exactly on duration_sec, so dt wouldn't quite be 1/fs.)
+    # A counter times a constant is also cheaper than linspace's math
+    dt = 1.0 / sample_rate_hz
+    time_axis = np.arange(num_samples, dtype=dtype)
+    time_axis *= dt
+
+    time_axis.flags.writeable = False
+    return time_axis
+
+
+def generate_sine(frequency_hz, amplitude, duration_sec, sample_rate_hz,
+                  dtype=np.float32, time_axis=None, use_recurrence=True):
     """
     Generate a pure sine wave.
 
@@ -67,29 +146,245 @@ def generate_sine(frequency_hz, amplitude, duration_sec, sample_rate_hz):
         How long to generate the signal for
     sample_rate_hz : int
         How many samples to take per second (must be ≥ 2× frequency)
+    dtype : numpy dtype
+        Sample type of the signal (default float32 - half the memory of
+        float64). The time axis is always float64.
+        Pass np.float64 for very long signals that need exact phase
+    time_axis : ndarray, optional
+        Precomputed time axis (e.g. from generate_time_axis()). When
+        given, duration_sec and sample_rate_hz are not used
+    use_recurrence : bool
+        Allow the fast paths: copying one cycle when the period is a
+        whole number of samples, and the sine recurrence (see
+        _sine_recurrence) for long signals when Numba is installed.
+        False = always use np.sin
 
     Returns
     -------
-    time_axis : ndarray
-        Array of time values (x-axis for plotting)
+    time_axis : ndarray (float64)
+        Array of time values (x-axis for plotting; read-only, shared).
+        Spaced exactly 1/sample_rate_hz apart, starting at 0
     signal : ndarray
         Array of signal values (y-axis for plotting)
     """
     # Create time axis (this is where our signal lives)
     # 🎓 We need enough samples to capture the signal accurately
-    num_samples = int(duration_sec * sample_rate_hz)
-    time_axis = np.linspace(0, duration_sec, num_samples)
+    # (cached: the same duration and rate always give the same axis)
+    uniform_axis = time_axis is None
+    if uniform_axis:
+        time_axis = generate_time_axis(duration_sec, sample_rate_hz)
 
     # Generate the wave (magic happens here!)
     # 🎓 2π converts frequency from cycles/sec to radians/sec
     # Radians are the natural unit for trigonometric functions
     angular_freq = 2 * np.pi * frequency_hz
-    signal = amplitude * np.sin(angular_freq * time_axis)
+
+    num_samples = len(time_axis)
+
+    # 🎓 WHOLE-NUMBER PERIOD: if the wave repeats every P samples exactly
+    # (e.g. 10 Hz at 1000 Hz → P = 100), only one cycle needs sin() -
+    # the rest of the signal is copies of it
+    if use_recurrence and uniform_axis and frequency_hz > 0:
+        period = sample_rate_hz / frequency_hz
+        if period.is_integer() and 1 < period <= num_samples:
+            signal = _tile_one_cycle(int(period), amplitude, num_samples, dtype)
+            return time_axis, signal
+
+    if (use_recurrence and _HAS_NUMBA and uniform_axis
+            and num_samples >= _RECURRENCE_MIN_SAMPLES
+            and np.dtype(dtype) in _KERNEL_DTYPES):
+        # Our own axis is evenly spaced (dt = 1/fs), so every sample
+        # advances the phase by the same angle
+        signal = _sine_recurrence(num_samples, angular_freq / sample_rate_hz,
+                                  amplitude, dtype)
+        return time_axis, signal
+
+    signal = np.empty(len(time_axis), dtype=dtype)
+    if num_samples == 0:
+        return time_axis, signal
+
+    # Largest angle sin() will see (our own axis ends at its last sample)
+    if uniform_axis:
+        t_max = float(time_axis[-1])
+    else:
+        t_max = float(np.max(np.abs(time_axis)))
+
+    if signal.dtype == np.float32 and abs(angular_freq) * t_max > _SIN_FAST_RANGE_F32:
+        # 🎓 PHASE REDUCTION: sin repeats every cycle, so only the
+        # position inside the current cycle matters. f·t counts cycles;
+        # subtracting the nearest whole number leaves -0.5..0.5 cycles,
+        # i.e. an angle of -π..π that sin() handles at full SIMD speed.
+        # The cycle count is reduced in float64 (where it's exact) and
+        # only the small leftover angle is rounded to float32
+        _reduce_phase_f32(time_axis, frequency_hz, signal)
+    else:
+        np.multiply(time_axis, angular_freq, out=signal)
+
+    # 🎓 IN-PLACE MATH: sin and the amplitude scaling reuse the same
+    # buffer instead of allocating a new array for every step
+    np.sin(signal, out=signal)
+    signal *= amplitude
 
     return time_axis, signal
 
 
-def generate_square(frequency_hz, amplitude, duration_sec, sample_rate_hz):
+def _reduce_phase_f32(time_axis, frequency_hz, out):
+    """Write 2π·(f·t − round(f·t)) into the float32 array out, slice by slice."""
+    num_samples = len(time_axis)
+    chunk = min(num_samples, _PHASE_CHUNK)
+    cycles_buf = np.empty(chunk)
+    whole_buf = np.empty(chunk)
+    for start in range(0, num_samples, _PHASE_CHUNK):
+        end = min(start + _PHASE_CHUNK, num_samples)
+        n = end - start
+
+        cycles = np.multiply(time_axis[start:end], frequency_hz,
+                             out=cycles_buf[:n], dtype=np.float64)
+        whole = np.add(cycles, 0.5, out=whole_buf[:n])
+        np.floor(whole, out=whole)
+        cycles -= whole
+        np.multiply(cycles, 2 * np.pi, out=out[start:end],
+                    casting='same_kind')
+
+
+def _tile_one_cycle(period, amplitude, num_samples, dtype=np.float32):
+    """
+    amplitude * sin(2π·n/period) for n = 0 .. num_samples-1, computing
+    sin() for a single cycle of `period` samples and copying it along.
+
+    The cycle is computed in float64 from the exact angles 2π·k/period,
+    so the copies are as accurate as the first cycle - more accurate
+    than sin() of a long (rounded) time axis.
+    """
+    one_cycle = np.sin(2 * np.pi * np.arange(period) / period)
+    one_cycle *= amplitude
+
+    signal = np.empty(num_samples, dtype=dtype)
+    full_cycles = num_samples // period
+    used = full_cycles * period
+
+    # Broadcast the cycle into every row of a (cycles, period) view,
+    # then finish the last partial cycle
+    signal[:used].reshape(full_cycles, period)[...] = one_cycle
+    signal[used:] = one_cycle[:num_samples - used]
+    return signal
+
+
+def _sine_recurrence(num_samples, theta, amplitude, dtype=np.float32):
+    """
+    amplitude * sin(n * theta) for n = 0 .. num_samples-1, without np.sin.
+
+    🎓 TEACHING NOTE:
+    For evenly spaced samples there's a neat identity:
+
+        sin((n+1)θ) = 2·cos(θ)·sin(nθ) − sin((n−1)θ)
+
+    Each new sample is one multiply and one subtract from the previous
+    two - much cheaper than a full sin() call. Rounding errors slowly
+    build up, so every _RECURRENCE_BLOCK samples we restart from exact
+    sin() values; the error then never grows with signal length
+    (around 1e-10 - somewhat more for frequencies very close to 0 Hz or
+    to the Nyquist limit, where cos(θ) is close to ±1).
+    """
+    signal = np.empty(num_samples, dtype=dtype)
+    _sine_recurrence_kernel(signal, theta, amplitude, _RECURRENCE_BLOCK)
+    return signal
+
+
+@njit(fastmath=True)
+def _sine_recurrence_kernel(out, theta, amplitude, block):
+    """Numba kernel for _sine_recurrence() (fills out in place)."""
+    n = out.shape[0]
+    c = 2.0 * math.cos(theta)
+    for start in range(0, n, block):
+        # Exact seeds for this block (kept in float64 whatever out's dtype)
+        s_prev = math.sin(start * theta)
+        s_cur = math.sin((start + 1) * theta)
+        out[start] = amplitude * s_prev
+        if start + 1 < n:
+            out[start + 1] = amplitude * s_cur
+        for i in range(start + 2, min(start + block, n)):
+            s_next = c * s_cur - s_prev
+            out[i] = amplitude * s_next
+            s_prev = s_cur
+            s_cur = s_next
+
+
+def generate_sincos(frequency_hz, amplitude, duration_sec, sample_rate_hz,
+                    dtype=np.float32):
+    """
+    Generate a sine AND a cosine wave together (same time axis).
+
+    🎓 TEACHING NOTE:
+    Receivers often need both: multiplying by cos and sin of the
+    carrier gives the I (in-phase) and Q (quadrature) parts of a signal.
+    Producing them together shares the work - the time axis is read
+    once and both waves come out of the same loop.
+
+    With Numba, both waves come from a rotation: each step turns the
+    point (cos, sin) around the unit circle by the same angle θ:
+
+        sin((n+1)θ) = sin(nθ)·cos(θ) + cos(nθ)·sin(θ)
+        cos((n+1)θ) = cos(nθ)·cos(θ) − sin(nθ)·sin(θ)
+
+    (restarted from exact values every _RECURRENCE_BLOCK samples, as in
+    _sine_recurrence). Without Numba, the phase is computed once and
+    np.sin/np.cos both read it.
+
+    Parameters
+    ----------
+    Same as generate_sine()
+
+    Returns
+    -------
+    time_axis : ndarray
+        Time values (read-only, shared)
+    sine : ndarray
+        amplitude * sin(2π f t)
+    cosine : ndarray
+        amplitude * cos(2π f t)
+    """
+    time_axis = generate_time_axis(duration_sec, sample_rate_hz)
+    num_samples = len(time_axis)
+    angular_freq = 2 * np.pi * frequency_hz
+
+    sine = np.empty(num_samples, dtype=dtype)
+    cosine = np.empty(num_samples, dtype=dtype)
+
+    if _HAS_NUMBA and num_samples > 1 and np.dtype(dtype) in _KERNEL_DTYPES:
+        _sincos_rotation_kernel(sine, cosine, angular_freq / sample_rate_hz,
+                                amplitude, _RECURRENCE_BLOCK)
+        return time_axis, sine, cosine
+
+    # One phase array, read by both sin and cos (cosine doubles as the
+    # phase buffer, so it is overwritten last)
+    np.multiply(time_axis, angular_freq, out=cosine)
+    np.sin(cosine, out=sine)
+    np.cos(cosine, out=cosine)
+    sine *= amplitude
+    cosine *= amplitude
+
+    return time_axis, sine, cosine
+
+
+@njit(fastmath=True)
+def _sincos_rotation_kernel(sin_out, cos_out, theta, amplitude, block):
+    """Numba kernel for generate_sincos() (fills both arrays in place)."""
+    n = sin_out.shape[0]
+    cos_step = math.cos(theta)
+    sin_step = math.sin(theta)
+    for start in range(0, n, block):
+        # Exact seed for this block (kept in float64 whatever the dtype)
+        s = math.sin(start * theta)
+        c = math.cos(start * theta)
+        for i in range(start, min(start + block, n)):
+            sin_out[i] = amplitude * s
+            cos_out[i] = amplitude * c
+            s, c = s * cos_step + c * sin_step, c * cos_step - s * sin_step
+
+
+def generate_square(frequency_hz, amplitude, duration_sec, sample_rate_hz,
+                    time_axis=None, dtype=np.float32):
     """
     Generate a square wave (digital-like signal).
 
@@ -109,29 +404,49 @@ def generate_square(frequency_hz, amplitude, duration_sec, sample_rate_hz):
     -------
     time_axis, signal : ndarrays
     """
-    # Create time axis
-    num_samples = int(duration_sec * sample_rate_hz)
-    time_axis = np.linspace(0, duration_sec, num_samples)
+    # Create time axis (cached, like in generate_sine())
+    uniform_axis = time_axis is None
+    if uniform_axis:
+        time_axis = generate_time_axis(duration_sec, sample_rate_hz)
+
+    # Generate square wave from the position inside each cycle
+    # 🎓 A square wave is the SIGN of a sine wave - but we don't need the
+    # sine at all. sin(2π f t) is positive during the first half of
+    # every cycle, so we only need to know where in its cycle each
+    # sample falls ("phase", 0.0 to 1.0):
+    #    - First half  (phase < 0.5) becomes +amplitude
+    #    - Second half (phase ≥ 0.5) becomes -amplitude
+    # (Convention: start high, at the very start of each cycle)
+    if _HAS_NUMBA and uniform_axis and np.dtype(dtype) in _KERNEL_DTYPES:
+        # One compiled loop: a multiply, a floor and a compare per sample
+        signal = np.empty(len(time_axis), dtype=dtype)
+        _square_kernel(signal, frequency_hz / sample_rate_hz, amplitude)
+        return time_axis, signal
+
+    # Cycles elapsed at each sample; subtracting the whole cycles keeps
+    # just the fractional part (float64 so late samples of long signals
+    # keep their exact phase)
+    phase = np.multiply(time_axis, frequency_hz, dtype=np.float64)
+    phase -= np.floor(phase)
+
+    # Branchless pick between the two levels (no sin, no sign, no fix-up)
+    high = np.dtype(dtype).type(amplitude)
+    signal = np.where(phase < 0.5, high, -high)
 
-    # Generate square wave using the sign of a sine wave
-    # 🎓 A square wave is just a sine wave where we keep only the sign:
-    #    - Positive part becomes +amplitude
-    #    - Negative part becomes -amplitude
-    angular_freq = 2 * np.pi * frequency_hz
-    sine_wave = np.sin(angular_freq * time_axis)
-
-    # np.sign() converts positive values to +1, negative to -1
-    # Then we scale by amplitude
-    signal = amplitude * np.sign(sine_wave)
+    return time_axis, signal
 
-    # 🎓 EDGE CASE: np.sign(0) = 0, but we want a clean square wave
-    # Set zeros to +amplitude (convention: start high)
-    signal[signal == 0] = amplitude
 
-    return time_axis, signal
+@njit
+def _square_kernel(out, cycles_per_sample, amplitude):
+    """Numba kernel for generate_square() (fills out in place)."""
+    for i in range(out.shape[0]):
+        cycles = i * cycles_per_sample
+        phase = cycles - math.floor(cycles)
+        out[i] = amplitude if phase < 0.5 else -amplitude
 
 
-def plot_signal(time_axis, signal, title="Signal", xlabel="Time (seconds)", ylabel="Amplitude"):
+def plot_signal(time_axis, signal, title="Signal", xlabel="Time (seconds)", ylabel="Amplitude",
+                ax=None):
     """
     Plot a signal in the time domain with teaching-oriented labels.
 
@@ -151,13 +466,21 @@ def plot_signal(time_axis, signal, title="Signal", xlabel="Time (seconds)", ylab
         X-axis label
     ylabel : str
         Y-axis label
+    ax : matplotlib Axes, optional
+        Existing axes to draw on (cleared first). Reusing one set of
+        axes in a loop is much faster than creating a new figure per plot
 
     Returns
     -------
     fig, ax : matplotlib Figure and Axes objects
     """
-    # Create figure with good size for visibility
-    fig, ax = plt.subplots(figsize=(10, 4))
+    # Create figure with good size for visibility (or reuse the caller's)
+    new_figure = ax is None
+    if new_figure:
+        fig, ax = plt.subplots(figsize=(10, 4))
+    else:
+        fig = ax.figure
+        ax.clear()
 
     # Plot the signal with a clear, visible line
     ax.plot(time_axis, signal, linewidth=2, color='#2E86AB')
@@ -170,8 +493,10 @@ def plot_signal(time_axis, signal, title="Signal", xlabel="Time (seconds)", ylab
     # Add grid for easier reading
     ax.grid(True, alpha=0.3, linestyle='--')
 
-    # Make plot tight and clean
-    plt.tight_layout()
+    # Make plot tight and clean (layout only needs working out once -
+    # reused axes keep the layout they already have)
+    if new_figure:
+        fig.tight_layout()
 
     return fig, ax
 
@@ -191,6 +516,30 @@ def plot_signal(time_axis, signal, title="Signal", xlabel="Time (seconds)", ylab
 # Gotchas:
 #   - NumPy uses radians, not degrees
 #   - Sample rate must be ≥ 2× highest frequency (Nyquist theorem)
+#   - Long sines (>= 4096 samples, Numba installed) come from a
+#     recurrence, not np.sin: values agree to ~1e-10 (float64), but are
+#     not bit-identical. use_recurrence=False forces np.sin
+#   - When sample_rate_hz / frequency_hz is a whole number, generate_sine()
+#     computes ONE cycle and copies it (~5x faster than np.sin over the
+#     whole axis, and exact for long signals); the recurrence and np.sin
+#     paths below only run for other frequencies
+#   - float32 sines with angles past ~71k radians (e.g. 15 kHz for 1 s+)
+#     are phase-reduced to -π..π before np.sin - NumPy's vectorized
+#     float32 sin is ~5x slower above that range. The reduction itself
+#     runs in float64 slices; reducing an already-rounded float32 cycle
+#     count would be LESS accurate than no reduction. float64 is left alone:
+#     its np.sin has no such cliff and the extra passes only cost time
+#   - generate_sincos() returns THREE arrays (time, sine, cosine)
+#   - generate_square() never calls sin(): samples that land exactly on a
+#     zero crossing may differ from np.sign(np.sin(...)) by rounding
+#   - The returned time_axis is read-only: it is cached and shared by
+#     every signal with the same duration and sample rate. Copy it
+#     (time_axis.copy()) before modifying
+#   - The Numba kernels only take float32/float64 output (compiled on
+#     first call); other dtypes (e.g. float16) use the NumPy path
+#   - No cache=True on the kernels: Numba's disk cache records the
+#     importing module's name, and this module is imported both as
+#     src.signals.generator (self_test) and signals.generator (Streamlit)
 
 
 # ═══ FUTURE IMPROVEMENTS ═══
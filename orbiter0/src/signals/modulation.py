@@ -27,7 +27,16 @@ SIMPLIFICATIONS:
   - Only BPSK (simplest modulation)
   - No carrier recovery or synchronization
   - Perfect symbol timing
-  - Ignoring I/Q representation for now
+  - I/Q only as an add-on (modulate_bpsk_iq); the pipeline is real-valued
+
+I/Q LAYOUT:
+  An I/Q stream is stored as TWO plain float32 arrays (IQSignal.I and
+  IQSignal.Q) rather than one complex64 array. complex64 interleaves
+  them in memory - I0 Q0 I1 Q1 ... - so code that only needs I still
+  drags every Q value through the cache, and NumPy often has no SIMD
+  path for complex math. Two separate arrays ("structure of arrays")
+  let every step be an ordinary float32 ufunc. Convert with
+  IQSignal.from_complex() / .to_complex() when you need complex numbers.
 
 ═══════════════════════════════════════════════════════════════════
 """
@@ -59,9 +68,170 @@ SIMPLIFICATIONS:
 # │                                                        │
 # └────────────────────────────────────────────────────────┘
 
+import functools
+from dataclasses import dataclass
+
 import numpy as np
 
 
+# ═══════════════════════════════════════════════════════════════
+# CARRIER CACHE
+# ═══════════════════════════════════════════════════════════════
+
+# Samples per slice when building a carrier: 16k float64 = 128 KB of
+# scratch, small enough to stay in L2 cache
+_CARRIER_CHUNK = 16384
+
+
+@functools.lru_cache(maxsize=16)
+def _get_carrier(carrier_freq_hz, sample_rate_hz, num_samples):
+    """
+    Time axis and carrier sine for a signal of num_samples samples.
+
+    🎓 TEACHING NOTE:
+    A satellite pass sends the same message again and again, so the
+    carrier (and its time axis) is identical every time. Computing
+    np.sin over thousands of samples is the expensive part - so we
+    compute it once and remember it. Both arrays are marked read-only
+    because every caller shares the same copy!
+
+    The carrier is stored as float32: BPSK only needs the sign of each
+    sample, so float64 precision would just double the memory traffic.
+    The time axis stays float64 so long signals keep exact timestamps.
+
+    The sine is worked out one _CARRIER_CHUNK-sample slice at a time in
+    small scratch buffers that stay in cache, instead of building
+    full-length float64 temporaries that each make a round trip through
+    main memory before the float32 copy.
+
+    The sine itself runs in float32, where NumPy uses its SIMD sin
+    (8-16 sines per instruction). float32 can't hold a phase of
+    thousands of radians accurately, so the phase is first reduced to
+    the position inside the current cycle - in float64, where it's
+    exact - and only that 0..2π angle is rounded to float32.
+
+    When the carrier repeats every whole number of samples
+    (sample_rate_hz / carrier_freq_hz is an integer, as with the
+    default 1 kHz at 10 kHz), one cycle is computed and copied instead.
+    """
+    # 🎓 Sample n sits at exactly n × dt (dt = 1 / sample rate), the same
+    # axis generate_time_axis() builds - np.linspace would stretch dt
+    # slightly so the last sample lands on num_samples / sample_rate
+    time_axis = np.arange(num_samples, dtype=np.float64)
+    time_axis *= 1.0 / sample_rate_hz
+    carrier = _carrier_wave(time_axis, carrier_freq_hz, sample_rate_hz, np.sin)
+
+    time_axis.setflags(write=False)
+    carrier.setflags(write=False)
+    return time_axis, carrier
+
+
+@functools.lru_cache(maxsize=16)
+def _get_quadrature_carrier(carrier_freq_hz, sample_rate_hz, num_samples):
+    """
+    Cosine partner of _get_carrier()'s sine (same time axis, also cached
+    and read-only). Only the I/Q modulator needs it.
+    """
+    time_axis, _ = _get_carrier(carrier_freq_hz, sample_rate_hz, num_samples)
+    carrier = _carrier_wave(time_axis, carrier_freq_hz, sample_rate_hz, np.cos)
+    carrier.setflags(write=False)
+    return carrier
+
+
+def clear_carrier_cache():
+    """
+    Forget every cached carrier (and time axis).
+
+    🎓 TEACHING NOTE:
+    The cache holds at most 16 carriers of each kind, so it can't grow
+    forever - but one carrier for a very long signal can be large. Call
+    this after a big one-off run to hand that memory back.
+    """
+    _get_carrier.cache_clear()
+    _get_quadrature_carrier.cache_clear()
+
+
+def _carrier_wave(time_axis, carrier_freq_hz, sample_rate_hz, trig):
+    """trig(2π·f·t) as float32, built slice by slice (see _get_carrier)."""
+    num_samples = len(time_axis)
+    carrier = np.empty(num_samples, dtype=np.float32)
+
+    # 🎓 WHOLE-NUMBER PERIOD: e.g. 1 kHz at 10 kHz repeats every 10
+    # samples exactly - compute one cycle from the exact angles 2π·k/P
+    # (in float64) and copy it along, with no trig on the long axis
+    period = sample_rate_hz / carrier_freq_hz if carrier_freq_hz > 0 else 0.0
+    if float(period).is_integer() and 1 < period <= num_samples:
+        period = int(period)
+        one_cycle = trig(2 * np.pi * np.arange(period) / period)
+        full_cycles = num_samples // period
+        used = full_cycles * period
+        carrier[:used].reshape(full_cycles, period)[...] = one_cycle
+        carrier[used:] = one_cycle[:num_samples - used]
+        return carrier
+
+    chunk = min(num_samples, _CARRIER_CHUNK)
+    cycles_buf = np.empty(chunk)
+    whole_buf = np.empty(chunk)
+    for start in range(0, num_samples, _CARRIER_CHUNK):
+        end = min(start + _CARRIER_CHUNK, num_samples)
+        n = end - start
+
+        # 🎓 cycles = f·t; keep only the fraction of the current cycle
+        cycles = np.multiply(time_axis[start:end], carrier_freq_hz,
+                             out=cycles_buf[:n])
+        cycles -= np.floor(cycles, out=whole_buf[:n])
+
+        # Fraction of a cycle → angle (float32), then sin/cos in place
+        angle = np.multiply(cycles, 2 * np.pi, out=carrier[start:end],
+                            casting='same_kind')
+        trig(angle, out=angle)
+
+    return carrier
+
+
+# ═══════════════════════════════════════════════════════════════
+# I/Q SIGNALS
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class IQSignal:
+    """
+    An I/Q (in-phase / quadrature) signal stored as two float32 arrays.
+
+    🎓 TEACHING NOTE:
+    Radios describe a signal with two numbers per sample: I (how much
+    it lines up with a cosine) and Q (how much with a sine). Together
+    they're one complex number I + jQ. We keep I and Q in separate
+    arrays - see "I/Q LAYOUT" at the top of this module for why.
+
+    Attributes
+    ----------
+    I : ndarray of float32
+        In-phase component
+    Q : ndarray of float32
+        Quadrature component (same length as I)
+    """
+    I: np.ndarray
+    Q: np.ndarray
+
+    def __len__(self):
+        return len(self.I)
+
+    @classmethod
+    def from_complex(cls, z):
+        """Split a complex array into I (real part) and Q (imaginary part)."""
+        z = np.asarray(z)
+        return cls(np.ascontiguousarray(z.real, dtype=np.float32),
+                   np.ascontiguousarray(z.imag, dtype=np.float32))
+
+    def to_complex(self):
+        """Combine into one complex64 array, I + jQ."""
+        z = np.empty(len(self.I), dtype=np.complex64)
+        z.real = self.I
+        z.imag = self.Q
+        return z
+
+
 def text_to_bits(text):
     """
     Convert text string to list of bits.
@@ -80,23 +250,18 @@ def text_to_bits(text):
 
     Returns
     -------
-    bits : list of int
-        List of 0s and 1s
+    bits : ndarray of uint8
+        Array of 0s and 1s (8 per byte, most significant bit first)
     """
     # Convert text to bytes using UTF-8 encoding
     # 🎓 UTF-8 is the standard text encoding (supports all languages!)
     text_bytes = text.encode('utf-8')
 
     # Convert each byte to 8 bits
-    bits = []
-    for byte in text_bytes:
-        # Convert byte to binary string, e.g., 72 → '01001000'
-        # Format: {:08b} means "8 digits, binary, zero-padded"
-        byte_bits = format(byte, '08b')
-
-        # Convert each character '0' or '1' to integer 0 or 1
-        for bit_char in byte_bits:
-            bits.append(int(bit_char))
+    # 🎓 np.unpackbits does format(byte, '08b') for every byte at once:
+    #   72 → [0, 1, 0, 0, 1, 0, 0, 0]
+    # frombuffer just views the bytes as uint8 numbers (no copy)
+    bits = np.unpackbits(np.frombuffer(text_bytes, dtype=np.uint8))
 
     return bits
 
@@ -111,38 +276,24 @@ def bits_to_text(bits):
 
     Parameters
     ----------
-    bits : list of int
-        List of 0s and 1s (must be multiple of 8)
+    bits : list of int or ndarray
+        0s and 1s (zero-padded to a multiple of 8)
 
     Returns
     -------
     text : str
         Decoded message
     """
-    # Check that bits length is multiple of 8
-    # 🎓 Each character is 8 bits (1 byte)
-    if len(bits) % 8 != 0:
-        # Pad with zeros if needed (or could raise error)
-        bits = bits + [0] * (8 - len(bits) % 8)
-
     # Group bits into bytes
-    bytes_list = []
-    for i in range(0, len(bits), 8):
-        # Get 8 bits
-        byte_bits = bits[i:i+8]
-
-        # Convert bit list to string like '01001000'
-        bit_string = ''.join(str(b) for b in byte_bits)
-
-        # Convert binary string to integer
-        byte_value = int(bit_string, 2)
-
-        bytes_list.append(byte_value)
+    # 🎓 np.packbits is the reverse of np.unpackbits: every 8 bits
+    # become one byte. If the length isn't a multiple of 8 the last
+    # byte is padded with zeros (each character is 8 bits = 1 byte)
+    bytes_list = np.packbits(np.asarray(bits, dtype=np.uint8))
 
     # Convert bytes to text
     # 🎓 Handle errors gracefully - replace invalid bytes with �
     try:
-        text = bytes(bytes_list).decode('utf-8', errors='replace')
+        text = bytes_list.tobytes().decode('utf-8', errors='replace')
     except Exception:
         text = "<?>"  # Fallback for corrupted data
 
@@ -162,22 +313,27 @@ def bits_to_bpsk_symbols(bits):
 
     Parameters
     ----------
-    bits : list of int
-        List of 0s and 1s
+    bits : list of int or ndarray
+        0s and 1s (e.g. the uint8 array from text_to_bits())
 
     Returns
     -------
-    symbols : ndarray
+    symbols : ndarray of int8
         Array of -1s and +1s
     """
     # Convert bits to numpy array for vectorized operations
-    bits_array = np.array(bits)
+    # (int8: signed, so uint8 bits from np.unpackbits can't wrap to 255,
+    # and one byte per symbol is all ±1 needs). This is a fresh copy -
+    # the math below then happens in place, with no further arrays
+    symbols = np.array(bits, dtype=np.int8)
 
     # BPSK mapping: 0 → -1, 1 → +1
     # 🎓 Math trick: symbol = 2 * bit - 1
     #   When bit = 0: 2*0 - 1 = -1
     #   When bit = 1: 2*1 - 1 = +1
-    symbols = 2 * bits_array - 1
+    # (doubling an integer is the same as shifting its bits left by one)
+    symbols <<= 1
+    symbols -= 1
 
     return symbols
 
@@ -203,28 +359,36 @@ def bpsk_symbols_to_bits(symbols):
 
     Returns
     -------
-    bits : list of int
-        Decoded bits
+    bits : ndarray of uint8
+        Decoded bits (same layout as np.unpackbits output)
     """
     # Decision rule: Check sign of each symbol
     # 🎓 Simple threshold detector at zero
     #   symbol > 0 → bit 1
     #   symbol ≤ 0 → bit 0
+    #
+    # One comparison over the whole array gives True/False per symbol;
+    # as uint8 those are exactly the bits 1/0. Same as:
+    #   bits = [1 if symbol > 0 else 0 for symbol in symbols]
+    # without a Python-level step per symbol.
+    # 🎓 A NumPy bool is stored as one byte holding 0 or 1, so .view()
+    # just relabels the comparison result as uint8 - no second copy
+    bits = (np.asarray(symbols) > 0).view(np.uint8)
 
-    bits = []
-    for symbol in symbols:
-        if symbol > 0:
-            bits.append(1)
-        else:
-            bits.append(0)
+    return bits
 
-    # Alternative vectorized version (commented out for teaching clarity):
-    # bits = (symbols > 0).astype(int).tolist()
 
-    return bits
+def _samples_per_symbol(carrier_freq_hz, sample_rate_hz):
+    """
+    Samples used for each BPSK symbol.
+
+    🎓 More samples = smoother wave, but more data
+    We'll use at least 10 samples per carrier cycle for smooth visualization
+    """
+    return max(100, int(sample_rate_hz / carrier_freq_hz) * 10)
 
 
-def modulate_bpsk(symbols, carrier_freq_hz, sample_rate_hz):
+def modulate_bpsk(symbols, carrier_freq_hz, sample_rate_hz, *, out=None):
     """
     Modulate BPSK symbols onto a carrier wave.
 
@@ -243,44 +407,101 @@ def modulate_bpsk(symbols, carrier_freq_hz, sample_rate_hz):
         Frequency of carrier wave
     sample_rate_hz : int
         Sampling rate
+    out : ndarray of float32, optional
+        Buffer to write the waveform into (keyword only). Used when its
+        length matches; otherwise a new array is returned
 
     Returns
     -------
-    signal : ndarray
-        Modulated waveform
+    signal : ndarray of float32
+        Modulated waveform (this IS out when one was used)
     time_axis : ndarray
-        Time values for the signal
+        Time values for the signal (read-only, shared between calls)
     """
     # Determine how many samples per symbol
-    # 🎓 More samples = smoother wave, but more data
-    # We'll use at least 10 samples per carrier cycle for smooth visualization
-    samples_per_symbol = max(100, int(sample_rate_hz / carrier_freq_hz) * 10)
+    samples_per_symbol = _samples_per_symbol(carrier_freq_hz, sample_rate_hz)
 
-    # Calculate total duration
+    # Total duration is num_samples / sample_rate_hz
     num_symbols = len(symbols)
-    duration_sec = num_symbols * samples_per_symbol / sample_rate_hz
-
-    # Create time axis
     num_samples = num_symbols * samples_per_symbol
-    time_axis = np.linspace(0, duration_sec, num_samples)
 
-    # Create carrier wave
+    # Create time axis and carrier wave
     # 🎓 Carrier is just a sine wave at the specified frequency
-    angular_freq = 2 * np.pi * carrier_freq_hz
-    carrier = np.sin(angular_freq * time_axis)
+    # (cached: repeated transmissions of the same length reuse it)
+    time_axis, carrier = _get_carrier(carrier_freq_hz, sample_rate_hz,
+                                      num_samples)
 
     # Upsample symbols to match carrier length
-    # 🎓 Each symbol needs to be repeated for samples_per_symbol samples
-    symbols_upsampled = np.repeat(symbols, samples_per_symbol)
+    # 🎓 Each symbol needs to be repeated for samples_per_symbol samples.
+    # Viewing the carrier as a (num_symbols, samples_per_symbol) grid and
+    # multiplying by a column of symbols does that repeat for free -
+    # broadcasting stretches each symbol across its row, no repeated copy
+    symbols_column = np.asarray(symbols).reshape(num_symbols, 1)
+    carrier_grid = carrier.reshape(num_symbols, samples_per_symbol)
+
+    if (out is None or out.shape != (num_samples,) or out.dtype != np.float32
+            or not out.flags.c_contiguous):
+        out = np.empty(num_samples, dtype=np.float32)
 
     # Modulate: multiply carrier by symbols
     # 🎓 Symbol +1 → normal carrier
     #    Symbol -1 → inverted carrier (180° phase shift)
-    signal = symbols_upsampled * carrier
+    np.multiply(symbols_column, carrier_grid,
+                out=out.reshape(num_symbols, samples_per_symbol))
+    signal = out
 
     return signal, time_axis
 
 
+def modulate_bpsk_iq(symbols, carrier_freq_hz, sample_rate_hz):
+    """
+    Modulate BPSK symbols onto a carrier, keeping both I and Q.
+
+    🎓 TEACHING NOTE:
+    Same idea as modulate_bpsk(), but we multiply the symbols by BOTH a
+    cosine and a sine carrier:
+      I = symbols · cos(2π·f·t)
+      Q = symbols · sin(2π·f·t)
+    Q is exactly the signal modulate_bpsk() returns; I is its 90°
+    shifted twin. Each is one float32 multiply into its own array.
+
+    Parameters
+    ----------
+    symbols : ndarray
+        BPSK symbols (-1 or +1)
+    carrier_freq_hz : float
+        Frequency of carrier wave
+    sample_rate_hz : int
+        Sampling rate
+
+    Returns
+    -------
+    iq : IQSignal
+        I and Q waveforms (float32)
+    time_axis : ndarray
+        Time values for the signal (read-only, shared between calls)
+    """
+    samples_per_symbol = _samples_per_symbol(carrier_freq_hz, sample_rate_hz)
+    num_symbols = len(symbols)
+    num_samples = num_symbols * samples_per_symbol
+
+    time_axis, sine = _get_carrier(carrier_freq_hz, sample_rate_hz,
+                                   num_samples)
+    cosine = _get_quadrature_carrier(carrier_freq_hz, sample_rate_hz,
+                                     num_samples)
+
+    # Same broadcast trick as modulate_bpsk(): a column of symbols times
+    # a (symbols, samples) view of each carrier
+    symbols_column = np.asarray(symbols).reshape(num_symbols, 1)
+    grid = (num_symbols, samples_per_symbol)
+    iq = IQSignal(np.empty(num_samples, dtype=np.float32),
+                  np.empty(num_samples, dtype=np.float32))
+    np.multiply(symbols_column, cosine.reshape(grid), out=iq.I.reshape(grid))
+    np.multiply(symbols_column, sine.reshape(grid), out=iq.Q.reshape(grid))
+
+    return iq, time_axis
+
+
 def demodulate_bpsk(signal, carrier_freq_hz, sample_rate_hz, symbols_count):
     """
     Demodulate BPSK signal back to symbols.
@@ -306,7 +527,7 @@ def demodulate_bpsk(signal, carrier_freq_hz, sample_rate_hz, symbols_count):
 
     Returns
     -------
-    symbols : ndarray
+    symbols : ndarray of int8
         Recovered symbols (may have errors due to noise)
     """
     # Calculate samples per symbol
@@ -315,36 +536,130 @@ def demodulate_bpsk(signal, carrier_freq_hz, sample_rate_hz, symbols_count):
         samples_per_symbol = 1
 
     # Create carrier for demodulation
-    # 🎓 We need the same carrier to "unmix" the signal
-    time_axis = np.linspace(0, len(signal) / sample_rate_hz, len(signal))
-    angular_freq = 2 * np.pi * carrier_freq_hz
-    carrier = np.sin(angular_freq * time_axis)
-
-    # Demodulate: multiply by carrier
-    # 🎓 This shifts the signal back to baseband
-    demod_signal = signal * carrier
+    # 🎓 We need the same carrier to "unmix" the signal - and it's the
+    # exact one modulate_bpsk() used, so it usually comes from the cache
+    _, carrier = _get_carrier(carrier_freq_hz, sample_rate_hz, len(signal))
 
     # Integrate over each symbol period to recover symbols
     # 🎓 Integration helps reduce noise effects
-    symbols = []
-    for i in range(symbols_count):
-        start_idx = i * samples_per_symbol
-        end_idx = start_idx + samples_per_symbol
+    #
+    # Viewing the signal as a table with one ROW per symbol:
+    #
+    #   row 0: [s0  s1  ... s99 ]   ← samples of symbol 0
+    #   row 1: [s100 ...    s199]   ← samples of symbol 1
+    #
+    # multiply-by-carrier-and-sum is a dot product of each signal row
+    # with the matching carrier row. np.einsum('ij,ij->i') does all of
+    # them in one pass, without building a demod_signal array first.
+    # (Reshaping is free - it's a view on the same memory.)
+    num_full = min(symbols_count, len(signal) // samples_per_symbol)
+    used = num_full * samples_per_symbol
+    symbol_sums = np.einsum(
+        'ij,ij->i',
+        signal[:used].reshape(num_full, samples_per_symbol),
+        carrier[:used].reshape(num_full, samples_per_symbol)
+    )
+
+    # The sign of the sum tells us the symbol
+    # 🎓 Positive sum → +1 symbol, Negative sum → -1 symbol
+    # (symbols with no samples left default to -1, as before)
+    symbols = np.full(symbols_count, -1, dtype=np.int8)
+    symbols[:num_full][symbol_sums > 0] = 1
+
+    return symbols
+
+
+# ═══════════════════════════════════════════════════════════════
+# BATCHES OF MESSAGES
+# ═══════════════════════════════════════════════════════════════
+
+def modulate_bpsk_batch(symbols, carrier_freq_hz, sample_rate_hz):
+    """
+    Modulate many equal-length messages at once (one per row).
+
+    🎓 TEACHING NOTE:
+    A BER sweep sends hundreds of messages of the same length. They all
+    ride on the SAME carrier, so instead of calling modulate_bpsk() once
+    per message we stack the messages as rows and broadcast:
+
+        (messages, symbols, 1) × (symbols, samples) → (messages, symbols, samples)
+
+    One NumPy call does every message, instead of one call each.
+
+    Parameters
+    ----------
+    symbols : ndarray, shape (num_messages, num_symbols)
+        BPSK symbols (-1 or +1), one message per row
+    carrier_freq_hz : float
+        Frequency of carrier wave
+    sample_rate_hz : int
+        Sampling rate
+
+    Returns
+    -------
+    signals : ndarray of float32, shape (num_messages, num_samples)
+        Row m is exactly modulate_bpsk(symbols[m], ...)[0]
+    time_axis : ndarray
+        Time values shared by every row (read-only)
+    """
+    symbols = np.asarray(symbols)
+    num_messages, num_symbols = symbols.shape
+    samples_per_symbol = _samples_per_symbol(carrier_freq_hz, sample_rate_hz)
+    num_samples = num_symbols * samples_per_symbol
+
+    time_axis, carrier = _get_carrier(carrier_freq_hz, sample_rate_hz,
+                                      num_samples)
+
+    signals = np.empty((num_messages, num_samples), dtype=np.float32)
+    np.multiply(symbols[:, :, np.newaxis],
+                carrier.reshape(num_symbols, samples_per_symbol),
+                out=signals.reshape(num_messages, num_symbols,
+                                    samples_per_symbol))
+    return signals, time_axis
+
+
+def demodulate_bpsk_batch(signals, carrier_freq_hz, sample_rate_hz,
+                          symbols_count):
+    """
+    Demodulate many equal-length received signals at once (one per row).
 
-        # Sum (integrate) over the symbol period
-        if end_idx <= len(demod_signal):
-            symbol_sum = np.sum(demod_signal[start_idx:end_idx])
-        else:
-            symbol_sum = np.sum(demod_signal[start_idx:])
+    🎓 TEACHING NOTE:
+    The batch version of demodulate_bpsk(): every row is multiplied by
+    the same carrier and summed per symbol period, all in one einsum.
 
-        # The sign of the sum tells us the symbol
-        # 🎓 Positive sum → +1 symbol, Negative sum → -1 symbol
-        if symbol_sum > 0:
-            symbols.append(1)
-        else:
-            symbols.append(-1)
+    Parameters
+    ----------
+    signals : ndarray, shape (num_messages, num_samples)
+        Received signals, one per row
+    carrier_freq_hz : float
+        Known carrier frequency
+    sample_rate_hz : int
+        Sampling rate
+    symbols_count : int
+        How many symbols each row holds
 
-    return np.array(symbols)
+    Returns
+    -------
+    symbols : ndarray of int8, shape (num_messages, symbols_count)
+        Row m matches demodulate_bpsk(signals[m], ...)
+    """
+    signals = np.asarray(signals)
+    num_messages, num_samples = signals.shape
+    samples_per_symbol = max(1, num_samples // symbols_count)
+
+    _, carrier = _get_carrier(carrier_freq_hz, sample_rate_hz, num_samples)
+
+    num_full = min(symbols_count, num_samples // samples_per_symbol)
+    used = num_full * samples_per_symbol
+    symbol_sums = np.einsum(
+        'mij,ij->mi',
+        signals[:, :used].reshape(num_messages, num_full, samples_per_symbol),
+        carrier[:used].reshape(num_full, samples_per_symbol)
+    )
+
+    symbols = np.full((num_messages, symbols_count), -1, dtype=np.int8)
+    symbols[:, :num_full][symbol_sums > 0] = 1
+    return symbols
 
 
 # ═══ DEBUGGING NOTES ═══
@@ -364,6 +679,21 @@ def demodulate_bpsk(signal, carrier_freq_hz, sample_rate_hz, symbols_count):
 #   - Symbol timing must be exact (samples per symbol)
 #   - Carrier frequency must match exactly for demodulation
 #   - Phase offset can invert all bits (not handled in basic version)
+#   - The time axis returned by modulate_bpsk() is cached and read-only;
+#     use time_axis.copy() if you need to modify it
+#   - Carriers are cached per (carrier_freq_hz, sample_rate_hz, samples);
+#     clear_carrier_cache() frees them
+#
+# Performance Notes:
+#   - modulate_bpsk()/demodulate_bpsk() have no per-symbol Python loop:
+#     one broadcast multiply / one einsum over the cached carrier
+#   - New carriers are built in _CARRIER_CHUNK slices, with sin() in
+#     float32 on a phase reduced to one cycle (SIMD fast path) - or, when
+#     the period is a whole number of samples, from one copied cycle
+#   - Waveforms stay float32 end to end; a float64 signal makes
+#     demodulate_bpsk() about 2x slower
+#   - Use modulate_bpsk_batch()/demodulate_bpsk_batch() for many
+#     same-length messages (e.g. BER sweeps)
 
 
 # ═══ FUTURE IMPROVEMENTS ═══
@@ -372,9 +702,13 @@ def demodulate_bpsk(signal, carrier_freq_hz, sample_rate_hz, symbols_count):
 #   [ ] Add QPSK modulation (2 bits per symbol)
 #   [ ] Implement carrier recovery (PLL)
 #   [ ] Add symbol timing recovery
-#   [ ] Support I/Q constellation diagrams
+#   [ ] Support I/Q constellation diagrams (IQSignal is the data side)
 #   [ ] Add soft-decision decoding
 #   [ ] Implement matched filtering
+#   [ ] Compiled modem core (Cython, prange) - only worth it once the
+#       project has a build step AND the carrier can't be cached (e.g.
+#       Doppler-shifted carriers); today's cached-carrier multiply
+#       already beats a per-sample sin() loop
 #
 # For Deep Space Version:
 #   [ ] Higher-order modulation (8PSK, 16QAM)
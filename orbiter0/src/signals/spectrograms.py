@@ -21,7 +21,7 @@ LEARNING GOALS:
   • Intro to Fourier analysis concepts
 
 SIMPLIFICATIONS:
-  - Using matplotlib's built-in spectrogram
+  - Same picture as matplotlib's built-in specgram (small NumPy STFT)
   - No windowing function explanations
   - Fixed time-frequency resolution
 
@@ -45,12 +45,123 @@ SIMPLIFICATIONS:
 # │                                                        │
 # └────────────────────────────────────────────────────────┘
 
+import functools
+
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib import mlab
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import rfft, rfftfreq
+
+# 🎓 scipy.fft instead of np.fft: same pocketfft algorithm, but it keeps
+# float32 input in single precision on every NumPy version, and
+# workers=-1 lets a batch of FFTs (one per spectrogram window) run on
+# all CPU cores
+_FFT_WORKERS = -1
+
+
+@functools.lru_cache(maxsize=8)
+def _hann_window(nfft, dtype):
+    """
+    Hann window of length nfft, built once per (nfft, dtype) and cached.
+
+    Returns (window, psd_scale): psd_scale turns |FFT|² into power per Hz
+    once divided by the sample rate. The window is read-only because
+    every caller shares it.
+    """
+    window = np.hanning(nfft).astype(dtype)
+    window.setflags(write=False)
+    return window, 1.0 / float(np.sum(window.astype(np.float64) ** 2))
+
+
+def _stft_power_db(signal, sample_rate_hz, nfft, noverlap):
+    """
+    Power spectral density of overlapping windows, in dB.
+
+    🎓 TEACHING NOTE:
+    This is what ax.specgram computes internally (default settings):
+    slice the signal into windows of nfft samples that overlap by
+    noverlap, taper each with a Hann window, FFT it, and keep the
+    power |X|². Doing it here lets us cache the window and hand
+    matplotlib a finished image instead of redoing that work per call.
+
+    Returns
+    -------
+    power_db : ndarray, shape (nfft // 2 + 1, num_windows)
+    freqs : ndarray
+        Frequency of each row (Hz)
+    t : ndarray
+        Centre time of each column (seconds)
+    """
+    window, psd_scale = _hann_window(nfft, signal.dtype)
+    step = nfft - noverlap
+
+    # 🎓 sliding_window_view is a zero-copy view: frame k starts at k*step
+    frames = sliding_window_view(signal, nfft)[::step]
+    spectrum = rfft(frames * window, axis=1, workers=_FFT_WORKERS)
+
+    # |X|² → power per Hz (same scaling as specgram's 'psd' mode);
+    # every bin except DC and Nyquist also collects its negative twin
+    power = spectrum.real ** 2
+    power += spectrum.imag ** 2
+    power *= psd_scale / sample_rate_hz
+    power[:, 1:(nfft + 1) // 2] *= 2
 
+    # 🎓 Power in decibels: 10·log10 (tiny floor avoids log10(0))
+    np.maximum(power, np.finfo(power.dtype).tiny, out=power)
+    power_db = np.log10(power, out=power)
+    power_db *= 10
 
-def generate_spectrogram(signal, sample_rate_hz, title="Spectrogram"):
+    freqs = rfftfreq(nfft, 1 / sample_rate_hz)
+    t = (np.arange(len(frames)) * step + nfft / 2) / sample_rate_hz
+    return power_db.T, freqs, t
+
+
+def _stft_power_db_cuda(signal, sample_rate_hz, nfft, noverlap):
+    """
+    GPU version of _stft_power_db (same result), using PyTorch on CUDA.
+
+    🎓 TEACHING NOTE:
+    A spectrogram of a long capture is thousands of independent FFTs -
+    exactly the kind of wide, regular work a graphics card is built
+    for. The signal is copied to the GPU once, every window is
+    transformed there, and only the finished dB image comes back.
+
+    Returns None when PyTorch or a CUDA device isn't available, so the
+    caller can fall back to the CPU path.
+    """
+    # 🎓 Imported here, not at the top: torch takes seconds to import
+    # and most users will never ask for the GPU
+    try:
+        import torch
+    except ImportError:
+        return None
+    if not torch.cuda.is_available():
+        return None
+
+    step = nfft - noverlap
+    x = torch.as_tensor(signal, dtype=torch.float32, device='cuda')
+
+    # periodic=False gives the same symmetric window as np.hanning;
+    # center=False frames exactly like _stft_power_db (no edge padding)
+    window = torch.hann_window(nfft, periodic=False, dtype=torch.float32,
+                               device='cuda')
+    spectrum = torch.stft(x, n_fft=nfft, hop_length=step, window=window,
+                          center=False, return_complex=True)
+
+    # Same PSD scaling and dB conversion as the CPU path
+    power = spectrum.abs().square_()
+    power *= 1.0 / (float(window.square().sum()) * sample_rate_hz)
+    power[1:(nfft + 1) // 2] *= 2
+    power_db = 10 * torch.log10(power.clamp_min_(torch.finfo(power.dtype).tiny))
+
+    num_frames = power_db.shape[1]
+    freqs = rfftfreq(nfft, 1 / sample_rate_hz)
+    t = (np.arange(num_frames) * step + nfft / 2) / sample_rate_hz
+    return power_db.cpu().numpy(), freqs, t
+
+
+def generate_spectrogram(signal, sample_rate_hz, title="Spectrogram",
+                         dtype=np.float32, ax=None, backend='cpu'):
     """
     Generate and plot a spectrogram (time-frequency representation).
 
@@ -77,6 +188,16 @@ def generate_spectrogram(signal, sample_rate_hz, title="Spectrogram"):
         Sampling rate of the signal
     title : str
         Title for the plot
+    dtype : numpy dtype
+        Precision for the analysis (default float32 - plenty for a
+        picture, and half the memory traffic of float64)
+    ax : matplotlib Axes, optional
+        Existing axes to draw on (cleared first; no colorbar is added,
+        so repeated calls don't stack colorbars)
+    backend : {'cpu', 'cuda'}
+        Where to compute the STFT. 'cuda' runs it on an NVIDIA GPU via
+        PyTorch - worth it for captures of millions of samples. Falls
+        back to 'cpu' when PyTorch or a GPU is missing
 
     Returns
     -------
@@ -85,27 +206,53 @@ def generate_spectrogram(signal, sample_rate_hz, title="Spectrogram"):
     ax : matplotlib Axes
         Axes object with the plot
     """
-    # Create figure with good size
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    # Generate spectrogram using matplotlib's built-in function
+    if backend not in ('cpu', 'cuda'):
+        raise ValueError(f"backend must be 'cpu' or 'cuda', got {backend!r}")
+
+    # Create figure with good size (or reuse the caller's axes)
+    new_figure = ax is None
+    if new_figure:
+        fig, ax = plt.subplots(figsize=(10, 6))
+    else:
+        fig = ax.figure
+        ax.clear()
+
+    # Spectrogram settings
     # 🎓 NFFT = number of points for FFT (affects frequency resolution)
     # noverlap = overlap between windows (affects time resolution)
     # More points = better frequency resolution but worse time resolution
     NFFT = 256  # Good balance for teaching
     noverlap = 128  # 50% overlap
 
-    # Compute and plot spectrogram
+    # 🎓 Shorter than one window? Zero-pad it to NFFT samples (what
+    # ax.specgram does), so there is exactly one window to show
+    signal = np.asarray(signal)
+    if signal.size < NFFT:
+        signal = np.pad(signal, (0, NFFT - signal.size))
+
+    # Compute spectrogram
     # 🎓 Returns:
-    #   spectrum: 2D array of power values
+    #   spectrum: 2D array of power values (dB)
     #   freqs: frequency bins
     #   t: time bins
-    #   im: the image plotted
-    spectrum, freqs, t, im = ax.specgram(
-        signal,
-        NFFT=NFFT,
-        Fs=sample_rate_hz,
-        noverlap=noverlap,
+    result = None
+    if backend == 'cuda':
+        result = _stft_power_db_cuda(signal, sample_rate_hz, NFFT, noverlap)
+    if result is None:
+        result = _stft_power_db(
+            np.asarray(signal, dtype=dtype), sample_rate_hz, NFFT, noverlap)
+    spectrum, freqs, t = result
+
+    # Plot it as an image (the same layout ax.specgram produces)
+    # 🎓 Each pixel is one (time window, frequency bin); the extent
+    # stretches pixels so the axes read in seconds and Hz
+    half_step = (NFFT - noverlap) / sample_rate_hz / 2
+    im = ax.imshow(
+        spectrum,
+        origin='lower',
+        aspect='auto',
+        interpolation='nearest',
+        extent=(t[0] - half_step, t[-1] + half_step, freqs[0], freqs[-1]),
         cmap='viridis'  # Color map (purple-green-yellow)
     )
 
@@ -114,17 +261,19 @@ def generate_spectrogram(signal, sample_rate_hz, title="Spectrogram"):
     ax.set_ylabel('Frequency (Hz)', fontsize=12)
     ax.set_title(title, fontsize=14, fontweight='bold')
 
-    # Add colorbar to show what colors mean
-    # 🎓 Color indicates signal strength (power) at that time/frequency
-    cbar = plt.colorbar(im, ax=ax)
-    cbar.set_label('Power/Frequency (dB/Hz)', fontsize=10)
+    if new_figure:
+        # Add colorbar to show what colors mean
+        # 🎓 Color indicates signal strength (power) at that time/frequency
+        cbar = fig.colorbar(im, ax=ax)
+        cbar.set_label('Power/Frequency (dB/Hz)', fontsize=10)
 
-    plt.tight_layout()
+        fig.tight_layout()
 
     return fig, ax
 
 
-def plot_frequency_spectrum(signal, sample_rate_hz, title="Frequency Spectrum"):
+def plot_frequency_spectrum(signal, sample_rate_hz, title="Frequency Spectrum",
+                            dtype=np.float32, ax=None):
     """
     Plot the frequency spectrum of a signal (single-sided).
 
@@ -145,37 +294,48 @@ def plot_frequency_spectrum(signal, sample_rate_hz, title="Frequency Spectrum"):
         Sampling rate
     title : str
         Plot title
+    dtype : numpy dtype
+        Precision for the FFT (default float32, see generate_spectrogram)
+    ax : matplotlib Axes, optional
+        Existing axes to draw on (cleared first)
 
     Returns
     -------
     fig, ax : matplotlib Figure and Axes
     freqs : ndarray
-        Frequency values
+        Frequency values, 0 Hz up to and including sample_rate_hz / 2
     magnitude : ndarray
         Magnitude at each frequency
     """
     # Compute FFT (Fast Fourier Transform)
     # 🎓 FFT converts time-domain signal → frequency-domain
+    # (asarray: no copy when the signal already has this dtype;
+    # the FFT then stays in single precision, complex64)
+    signal = np.asarray(signal, dtype=dtype)
     N = len(signal)
-    fft_output = np.fft.fft(signal)
 
-    # Compute magnitude (we only care about strength, not phase)
-    magnitude = np.abs(fft_output)
+    # 🎓 rfft: for a REAL signal the negative frequencies are mirror
+    # images of the positive ones, so rfft computes only the
+    # non-negative half (N//2 + 1 bins) - half the work and memory
+    fft_output = rfft(signal, workers=_FFT_WORKERS)
 
     # Compute frequency bins
-    # 🎓 FFT output spans from 0 to sample_rate
-    freqs = np.fft.fftfreq(N, 1/sample_rate_hz)
+    # 🎓 rfft bins run from 0 Hz up to sample_rate / 2 (Nyquist)
+    positive_freqs = rfftfreq(N, 1/sample_rate_hz)
 
-    # Take only positive frequencies (single-sided spectrum)
-    # 🎓 Negative frequencies are mirror images for real signals
-    positive_freqs = freqs[:N//2]
-    positive_magnitude = magnitude[:N//2]
+    # Compute magnitude (we only care about strength, not phase)
+    positive_magnitude = np.abs(fft_output)
 
-    # Normalize for better visualization
-    positive_magnitude = positive_magnitude / N
+    # Normalize for better visualization (in place - no extra array)
+    positive_magnitude *= 1.0 / N
 
-    # Create plot
-    fig, ax = plt.subplots(figsize=(10, 4))
+    # Create plot (or reuse the caller's axes)
+    new_figure = ax is None
+    if new_figure:
+        fig, ax = plt.subplots(figsize=(10, 4))
+    else:
+        fig = ax.figure
+        ax.clear()
 
     # Plot as line (frequency spectrum)
     ax.plot(positive_freqs, positive_magnitude, linewidth=1.5, color='#E63946')
@@ -186,7 +346,8 @@ def plot_frequency_spectrum(signal, sample_rate_hz, title="Frequency Spectrum"):
     ax.set_title(title, fontsize=14, fontweight='bold')
     ax.grid(True, alpha=0.3, linestyle='--')
 
-    plt.tight_layout()
+    if new_figure:
+        fig.tight_layout()
 
     return fig, ax, positive_freqs, positive_magnitude
 
@@ -209,6 +370,16 @@ def plot_frequency_spectrum(signal, sample_rate_hz, title="Frequency Spectrum"):
 #   - Time-frequency resolution trade-off (Heisenberg uncertainty!)
 #   - Colormap choice affects perception
 #   - FFT assumes periodic signals
+#   - Plotting many spectra in a loop? Create one figure and pass ax=...
+#     each time - new figures are the slow part
+#   - Signals shorter than NFFT (256 samples) are zero-padded to one
+#     window, so they show as a single column
+#   - backend='cuda' always computes in float32 (dtype is ignored) and
+#     needs roughly 8 bytes of GPU memory per sample - a 10M-sample
+#     capture wants ~100 MB free. It quietly uses the CPU when PyTorch
+#     or a GPU isn't there
+#   - Spectra are computed in float32 by default; pass dtype=np.float64
+#     to look for components far below the strongest one (> ~100 dB)
 
 
 # ═══ FUTURE IMPROVEMENTS ═══
@@ -209,6 +209,10 @@ def compute_crc16(data_bytes):
             crc &= 0xFFFF  # Keep only 16 bits
 
     return crc
+
+# ⚡ The simulator itself doesn't run this loop - Python's built-in
+# binascii.crc_hqx(data_bytes, 0xFFFF) computes the SAME CRC in C
+# (see comms/packetizer.py: _compute_crc16)
 '''
 
 SNIPPET_HAMMING_ENCODE = '''
@@ -246,6 +250,32 @@ def hamming_encode_block(data_bits):
     encoded = [p1, p2, d1, p4, d2, d3, d4]
 
     return encoded
+
+
+# Generator matrix: row = data bit (d1..d4), column = code position.
+# A 1 means "this data bit feeds this position" (the p columns are the
+# parity rules above, the d columns just copy the data bit through)
+G = np.array([[1, 1, 1, 0, 0, 0, 0],
+              [1, 0, 0, 1, 1, 0, 0],
+              [0, 1, 0, 1, 0, 1, 0],
+              [1, 1, 0, 1, 0, 0, 1]], dtype=np.uint8)
+
+
+def hamming_encode_blocks(data_bits):
+    """
+    Encode a whole message (a multiple of 4 bits) at once.
+
+    🎓 TEACHING NOTE:
+    XOR is addition mod 2, so the three parity rules are one matrix
+    multiply: every 4-bit block (a row) times G, then keep the lowest
+    bit (& 1). N blocks → one (N, 4) @ (4, 7) product, no Python loop.
+    """
+    blocks = np.asarray(data_bits, dtype=np.uint8).reshape(-1, 4)
+    return ((blocks @ G) & 1).ravel()
+
+# ⚡ The simulator XORs whole columns instead (see comms/decoder.py:
+# hamming_encode_message) - NumPy has no BLAS for integer @, so the
+# matrix form above is ~5x slower than three column XORs
 '''
 
 # ═══════════════════════════════════════════════════════════════
@@ -309,6 +339,11 @@ def apply_fading_events(signal, fade_events, sample_rate_hz, time_axis):
         faded_signal[start_idx:end_idx] *= attenuation
 
     return faded_signal
+
+# ⚡ The simulator builds one fade mask instead: fade start/end times go
+# into arrays, ONE np.searchsorted finds every fade's sample range, and
+# the signal is multiplied by the mask once (see channel/fades.py).
+# Pass out=signal to skip the copy when the original isn't needed
 '''
 
 # ═══════════════════════════════════════════════════════════════
@@ -345,6 +380,10 @@ def calculate_ber(original_bits, received_bits):
     ber = errors / min_len
 
     return ber
+
+# ⚡ The simulator counts errors 64 bits at a time instead: pack the bits
+# into bytes, XOR them, and popcount the result (see
+# utils/math_helpers.py: bit_errors_and_ber)
 '''
 
 SNIPPET_SNR_CALCULATION = '''
@@ -491,9 +530,13 @@ def get_snippet(name):
     return SNIPPETS.get(name, f"# Snippet '{name}' not found")
 
 
+# SNIPPETS never changes after import, so its names are listed once
+_SNIPPET_NAMES = tuple(SNIPPETS)
+
+
 def list_snippets():
-    """List all available snippet names."""
-    return list(SNIPPETS.keys())
+    """List all available snippet names (a shared, read-only tuple)."""
+    return _SNIPPET_NAMES
 
 
 # ═══════════════════════════════════════════════════════════════
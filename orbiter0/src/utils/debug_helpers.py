@@ -30,8 +30,20 @@ LEARNING GOALS:
 
 from typing import List, Tuple
 import sys
+
+import numpy as np
+
 sys.path.insert(0, '..')
 from comms.packetizer import parse_packet
+from utils.math_helpers import bit_errors_and_ber
+
+
+# 🎓 LOOKUP TABLES: there are only 256 possible bytes, so their text
+# forms are worked out once here instead of formatted on every call
+_BYTE_BITS = tuple(f"{v:08b}" for v in range(256))
+
+# For bytes.translate(): printable ASCII maps to itself, the rest to '.'
+_ASCII_TABLE = bytes(v if 32 <= v < 127 else ord('.') for v in range(256))
 
 
 def hexdump(data: bytes, bytes_per_line=16, show_ascii=True):
@@ -60,6 +72,7 @@ def hexdump(data: bytes, bytes_per_line=16, show_ascii=True):
     dump : str
         Formatted hexdump string
     """
+    data = bytes(data)
     lines = []
 
     for i in range(0, len(data), bytes_per_line):
@@ -69,17 +82,14 @@ def hexdump(data: bytes, bytes_per_line=16, show_ascii=True):
         # Format address (offset)
         address = f"{i:08x}"
 
-        # Format hex bytes
-        hex_bytes = ' '.join(f"{b:02x}" for b in chunk)
+        # Format hex bytes (bytes.hex does the whole chunk in C)
+        hex_bytes = chunk.hex(' ')
         # Pad if last line is short
         hex_bytes = hex_bytes.ljust(bytes_per_line * 3 - 1)
 
         # Format ASCII (printable chars only)
         if show_ascii:
-            ascii_repr = ''.join(
-                chr(b) if 32 <= b < 127 else '.'
-                for b in chunk
-            )
+            ascii_repr = chunk.translate(_ASCII_TABLE).decode('ascii')
             line = f"{address}  {hex_bytes}  |{ascii_repr}|"
         else:
             line = f"{address}  {hex_bytes}"
@@ -109,19 +119,27 @@ def diff_bytes(data1: bytes, data2: bytes):
     differences : List[dict]
         List of differences: [{'offset': int, 'byte1': int, 'byte2': int}, ...]
     """
-    max_len = max(len(data1), len(data2))
-    differences = []
-
-    for i in range(max_len):
-        byte1 = data1[i] if i < len(data1) else None
-        byte2 = data2[i] if i < len(data2) else None
-
-        if byte1 != byte2:
-            differences.append({
-                'offset': i,
-                'byte1': byte1,
-                'byte2': byte2
-            })
+    a = np.frombuffer(bytes(data1), dtype=np.uint8)
+    b = np.frombuffer(bytes(data2), dtype=np.uint8)
+    common = min(len(a), len(b))
+
+    # 🎓 COMPARE EVERYTHING AT ONCE
+    # XOR is 0 where two bytes match, so the nonzero positions are the
+    # differences. NumPy checks all bytes in one pass; Python only
+    # touches the (usually few) bytes that actually changed.
+    offsets = np.flatnonzero(a[:common] ^ b[:common]).tolist()
+    differences = [
+        {'offset': i, 'byte1': byte1, 'byte2': byte2}
+        for i, byte1, byte2 in zip(offsets, a[offsets].tolist(),
+                                   b[offsets].tolist())
+    ]
+
+    # Bytes past the end of the shorter sequence have nothing to match
+    # (None on the missing side)
+    for i, byte in enumerate(a[common:].tolist(), start=common):
+        differences.append({'offset': i, 'byte1': byte, 'byte2': None})
+    for i, byte in enumerate(b[common:].tolist(), start=common):
+        differences.append({'offset': i, 'byte1': None, 'byte2': byte})
 
     return differences
 
@@ -219,7 +237,7 @@ def inspect_packet(packet_bytes: bytes):
     # Preamble
     lines.append("\n[PREAMBLE] (bytes 0-3):")
     preamble = packet_bytes[:4]
-    lines.append(f"  Hex: {' '.join(f'{b:02X}' for b in preamble)}")
+    lines.append(f"  Hex: {preamble.hex(' ').upper()}")
     lines.append(f"  Expected: AA AA AA AA")
     if preamble == b'\xAA\xAA\xAA\xAA':
         lines.append("  ✓ Valid")
@@ -285,7 +303,7 @@ def bits_to_string(byte_value: int):
     bits : str
         Binary representation (e.g., "10101010")
     """
-    return f"{byte_value:08b}"
+    return _BYTE_BITS[byte_value]
 
 
 def visualize_bit_errors(original: bytes, corrupted: bytes):
@@ -334,6 +352,15 @@ def visualize_bit_errors(original: bytes, corrupted: bytes):
     if len(original) > 10:
         lines.append(f"\n... ({len(original) - 10} more bytes)")
 
+    # 🎓 The drawing above stops after 10 bytes, but the total covers
+    # every byte both sequences share - counted 64 bits at a time by
+    # bit_errors_and_ber(), not bit by bit
+    common = min(len(original), len(corrupted))
+    total_errors, _ = bit_errors_and_ber(original[:common],
+                                         corrupted[:common], common * 8)
+    lines.append(f"\nTotal bit errors: {total_errors} "
+                 f"(in {common} byte(s) compared)")
+
     return '\n'.join(lines)
 
 
@@ -72,9 +72,24 @@ def count_bit_errors(transmitted_bits, received_bits):
     error_positions : list
         Indices where errors occurred
     """
+    errors = _bit_error_mask(transmitted_bits, received_bits)
+
+    # Count total errors
+    # 🎓 count_nonzero counts the True values without summing them as numbers
+    num_errors = np.count_nonzero(errors)
+
+    # Find positions of errors (useful for debugging!)
+    error_positions = np.flatnonzero(errors).tolist()
+
+    return int(num_errors), error_positions
+
+
+def _bit_error_mask(transmitted_bits, received_bits):
+    """Boolean array, True wherever the two bit sequences differ."""
     # Convert to numpy arrays for easy comparison
-    tx_bits = np.array(transmitted_bits)
-    rx_bits = np.array(received_bits)
+    # (asarray: no copy when they already are arrays)
+    tx_bits = np.asarray(transmitted_bits)
+    rx_bits = np.asarray(received_bits)
 
     # Handle length mismatch (pad shorter sequence with zeros)
     # 🎓 In real systems, length mismatch is a big problem!
@@ -88,15 +103,7 @@ def count_bit_errors(transmitted_bits, received_bits):
 
     # Find where bits differ
     # 🎓 != operator creates boolean array: True where different
-    errors = (tx_bits != rx_bits)
-
-    # Count total errors
-    num_errors = np.sum(errors)
-
-    # Find positions of errors (useful for debugging!)
-    error_positions = np.where(errors)[0].tolist()
-
-    return int(num_errors), error_positions
+    return tx_bits != rx_bits
 
 
 def calculate_ber(transmitted_bits, received_bits):
@@ -128,7 +135,9 @@ def calculate_ber(transmitted_bits, received_bits):
         Total number of bits compared
     """
     # Count errors
-    num_errors, _ = count_bit_errors(transmitted_bits, received_bits)
+    # (only the count - the error positions aren't needed here)
+    num_errors = int(np.count_nonzero(
+        _bit_error_mask(transmitted_bits, received_bits)))
 
     # Total bits is the maximum length (in case of mismatch)
     total_bits = max(len(transmitted_bits), len(received_bits))
@@ -144,6 +153,68 @@ def calculate_ber(transmitted_bits, received_bits):
     return ber, num_errors, total_bits
 
 
+def bit_errors_and_ber(transmitted_packed, received_packed, num_bits):
+    """
+    Count bit errors and BER in one pass over PACKED bits (8 per byte).
+
+    🎓 TEACHING NOTE:
+    XOR is 1 exactly where two bits differ, so XOR-ing the packed bytes
+    marks every error at once - 8 bits per operation. Counting the 1s
+    ("population count") then gives the number of errors:
+
+      sent:     0100 1000   ('H')
+      received: 0110 1000
+      XOR:      0010 0000   → popcount = 1 error
+
+    Parameters
+    ----------
+    transmitted_packed : bytes or ndarray of uint8
+        Original bits, packed (e.g. the message bytes)
+    received_packed : bytes or ndarray of uint8
+        Received bits, packed with np.packbits
+    num_bits : int
+        How many bits to compare (bits past this are ignored)
+
+    Returns
+    -------
+    num_errors : int
+        Number of bit errors
+    ber : float
+        Bit Error Rate (between 0.0 and 1.0)
+    """
+    if num_bits == 0:
+        return 0, 0.0
+
+    num_bytes = -(-num_bits // 8)  # ceil(num_bits / 8)
+
+    # Buffers rounded up to whole 8-byte words (the zero padding XORs to
+    # 0), so the popcount below can work on 64 bits at a time
+    padded = -(-num_bytes // 8) * 8
+    tx = np.zeros(padded, dtype=np.uint8)
+    rx = np.zeros(padded, dtype=np.uint8)
+    tx_in = np.frombuffer(bytes(transmitted_packed), dtype=np.uint8)[:num_bytes]
+    rx_in = np.frombuffer(bytes(received_packed), dtype=np.uint8)[:num_bytes]
+    tx[:len(tx_in)] = tx_in
+    rx[:len(rx_in)] = rx_in  # Missing bytes count as zeros (like padding)
+
+    # 🎓 XOR ONCE: 1 wherever the bits differ
+    diff = np.bitwise_xor(tx, rx)
+
+    # Ignore the unused low bits of a partial last byte
+    if num_bits % 8:
+        diff[num_bytes - 1] &= (0xFF << (8 - num_bits % 8)) & 0xFF
+
+    # Count the 1s: np.bitwise_count (NumPy 2.0+) uses the CPU's popcount
+    # instruction - on uint64 words, one instruction covers 64 bits (~3x
+    # faster than per byte); older NumPy unpacks the XOR bytes and counts
+    if hasattr(np, 'bitwise_count'):
+        num_errors = int(np.bitwise_count(diff.view(np.uint64)).sum())
+    else:
+        num_errors = int(np.count_nonzero(np.unpackbits(diff)))
+
+    return num_errors, num_errors / num_bits
+
+
 def ber_to_quality_string(ber):
     """
     Convert BER to a human-readable quality assessment.
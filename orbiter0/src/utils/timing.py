@@ -99,6 +99,19 @@ class SatellitePass:
         """When satellite reaches maximum elevation."""
         return self.start_time + (self.duration / 2)
 
+    def elevation_at_time(self, t):
+        """Elevation angle (degrees) at a single time t (seconds)."""
+        return float(elevation_angle_curve(np.array([t], dtype=float), self)[0])
+
+    def elevation_at_times(self, times):
+        """
+        Elevation angles (degrees) for a whole array of times at once.
+
+        🎓 Same parabola as elevation_at_time(), evaluated by NumPy for
+        every time in one call instead of one Python call per time.
+        """
+        return elevation_angle_curve(np.asarray(times, dtype=float), self)
+
     def __repr__(self):
         return (f"SatellitePass(start={self.start_time:.1f}s, "
                 f"duration={self.duration:.1f}s, "
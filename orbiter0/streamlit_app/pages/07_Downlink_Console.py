@@ -143,13 +143,10 @@ if send_button and message:
                 nibble2 = byte_bits[4:]
                 payload_bits_list.extend(hamming_encode_4bit(nibble1))
                 payload_bits_list.extend(hamming_encode_4bit(nibble2))
-            # Convert bits back to bytes for packet
-            fec_bytes = bytearray()
-            for i in range(0, len(payload_bits_list), 8):
-                if i + 8 <= len(payload_bits_list):
-                    byte_val = sum(bit << (7 - j) for j, bit in enumerate(payload_bits_list[i:i+8]))
-                    fec_bytes.append(byte_val)
-            packet_payload = bytes(fec_bytes)
+            # Convert bits back to bytes for packet (whole bytes only)
+            whole_bits = len(payload_bits_list) // 8 * 8
+            packet_payload = np.packbits(
+                np.asarray(payload_bits_list[:whole_bits], dtype=np.uint8)).tobytes()
         else:
             packet_payload = payload_bytes
 
@@ -157,7 +154,8 @@ if send_button and message:
         packet_bytes = create_packet(packet_payload, packet_id=len(st.session_state.packet_log))
 
         # Step 2: Convert to bits and modulate
-        packet_bits = [int(b) for byte in packet_bytes for b in format(byte, '08b')]
+        # (np.unpackbits splits every byte into its 8 bits in one C loop)
+        packet_bits = np.unpackbits(np.frombuffer(packet_bytes, dtype=np.uint8))
         symbols = bits_to_bpsk_symbols(packet_bits)
 
         # Step 3: Modulate to signal
@@ -176,13 +174,9 @@ if send_button and message:
         demod_symbols = demodulate_bpsk(noisy_signal, carrier_freq, sample_rate, len(symbols))
         demod_bits = bpsk_symbols_to_bits(demod_symbols)
 
-        # Step 6: Convert back to bytes (packet)
-        received_bytes = bytearray()
-        for i in range(0, len(demod_bits), 8):
-            if i + 8 <= len(demod_bits):
-                byte_val = sum(bit << (7 - j) for j, bit in enumerate(demod_bits[i:i+8]))
-                received_bytes.append(byte_val)
-        received_packet = bytes(received_bytes)
+        # Step 6: Convert back to bytes (packet) - whole bytes only
+        whole_bits = len(demod_bits) // 8 * 8
+        received_packet = np.packbits(demod_bits[:whole_bits]).tobytes()
 
         # Step 7: Validate packet
         packet_valid = validate_packet(received_packet)
@@ -197,22 +191,21 @@ if send_button and message:
                 # If FEC was used, decode it
                 if use_fec:
                     # Convert payload back to bits
-                    fec_bits_received = [int(b) for byte in decoded_payload for b in format(byte, '08b')]
+                    fec_bits_received = np.unpackbits(
+                        np.frombuffer(decoded_payload, dtype=np.uint8)).tolist()
 
                     # Decode Hamming
                     decoded_bits = []
                     for i in range(0, len(fec_bits_received), 7):
                         if i + 7 <= len(fec_bits_received):
                             hamming_bits = fec_bits_received[i:i+7]
-                            data_bits = hamming_decode_4bit(hamming_bits)
+                            data_bits = hamming_decode_4bit(hamming_bits)['data_bits']
                             decoded_bits.extend(data_bits)
 
-                    # Convert bits back to bytes
-                    decoded_bytes = bytearray()
-                    for i in range(0, len(decoded_bits), 8):
-                        if i + 8 <= len(decoded_bits):
-                            byte_val = sum(bit << (7 - j) for j, bit in enumerate(decoded_bits[i:i+8]))
-                            decoded_bytes.append(byte_val)
+                    # Convert bits back to bytes (whole bytes only)
+                    whole_bits = len(decoded_bits) // 8 * 8
+                    decoded_bytes = np.packbits(
+                        np.asarray(decoded_bits[:whole_bits], dtype=np.uint8)).tobytes()
 
                     decoded_message = decoded_bytes.decode('utf-8', errors='replace')
                 else:
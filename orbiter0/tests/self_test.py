@@ -108,6 +108,18 @@ try:
     test("Sine amplitude correct", abs(np.max(sig) - 1.0) < 0.01,
          f"Expected ~1.0, got {np.max(sig):.3f}")
     test("Time axis length matches signal", len(t) == len(sig))
+
+    # Long signals may use the fast sine recurrence - must match np.sin
+    _, fast = generate_sine(440, 1.0, 2.0, 48000, dtype=np.float64)
+    _, exact = generate_sine(440, 1.0, 2.0, 48000, dtype=np.float64,
+                             use_recurrence=False)
+    test("Long sine matches np.sin", np.max(np.abs(fast - exact)) < 1e-6)
+
+    # float32 at high frequency: the phase is reduced in float64 first
+    t, f32 = generate_sine(15013.7, 1.0, 20.0, 48000, use_recurrence=False)
+    err = np.max(np.abs(f32 - np.sin(2 * np.pi * 15013.7 * t)))
+    test("Long float32 sine matches float64 np.sin", err < 1e-6,
+         f"Max error {err:.2e}")
 except Exception as e:
     test("Signal generation", False, str(e))
 
@@ -132,6 +144,31 @@ try:
     expected = np.array([-1, 1, -1, 1])
     test("BPSK symbol mapping", np.allclose(symbols, expected),
          f"Expected {expected}, got {symbols}")
+
+    # I/Q modulation: Q is the ordinary BPSK waveform, and the
+    # complex64 round trip keeps both parts
+    from src.signals.modulation import modulate_bpsk, modulate_bpsk_iq, IQSignal
+    iq, _ = modulate_bpsk_iq(symbols, 1000, 10000)
+    plain, _ = modulate_bpsk(symbols, 1000, 10000)
+    test("I/Q modulation matches BPSK", np.array_equal(iq.Q, plain))
+    # Carrier copied from one cycle (10 samples per cycle) and computed
+    # directly (1200 Hz: 8.33 samples per cycle) both match np.sin
+    for carrier_hz in (1000, 1200):
+        wave, t = modulate_bpsk(np.ones(4), carrier_hz, 10000)
+        err = np.max(np.abs(wave - np.sin(2 * np.pi * carrier_hz * t)))
+        test(f"BPSK carrier matches np.sin ({carrier_hz} Hz)", err < 1e-6,
+             f"Max error {err:.2e}")
+    back = IQSignal.from_complex(iq.to_complex())
+    test("I/Q complex round trip",
+         np.array_equal(back.I, iq.I) and np.array_equal(back.Q, iq.Q))
+
+    # Batched modulation: every row matches the single-message result
+    from src.signals.modulation import modulate_bpsk_batch, demodulate_bpsk_batch
+    batch = np.stack([symbols, -symbols])
+    signals, _ = modulate_bpsk_batch(batch, 1000, 10000)
+    test("Batch modulation matches BPSK", np.array_equal(signals[0], plain))
+    test("Batch demodulation round trip", np.array_equal(
+        demodulate_bpsk_batch(signals, 1000, 10000, 4), batch))
 except Exception as e:
     test("Modulation", False, str(e))
 
@@ -184,9 +221,26 @@ try:
     corrupted = bytearray(packet)
     corrupted[10] ^= 0xFF  # Flip bits in middle
     test("Packet validation (corrupted)", not validate_packet(bytes(corrupted)))
+
+    # Empty payload: header + CRC only
+    empty_packet = create_packet(b"", packet_id=7)
+    test("Empty packet validation", validate_packet(empty_packet) and
+         len(empty_packet) == 14,
+         f"Expected valid 14-byte packet, got {len(empty_packet)} bytes")
 except Exception as e:
     test("Packetization", False, str(e))
 
+try:
+    from src.comms.decoder import hamming_encode_message, hamming_decode_message
+    data_bits = np.unpackbits(np.frombuffer(b"FEC!", dtype=np.uint8))
+    encoded = hamming_encode_message(data_bits)
+    encoded[::7] ^= 1  # One flipped bit in every codeword
+    decoded = hamming_decode_message(encoded)
+    test("Hamming message round-trip with corrections",
+         len(encoded) == 56 and np.array_equal(decoded, data_bits))
+except Exception as e:
+    test("Hamming message coding", False, str(e))
+
 print()
 
 # ═══════════════════════════════════════════════════════════════
@@ -211,22 +265,48 @@ try:
     test("Message sent stored", result['message_sent'] == "Hello")
     test("Perfect transmission (high SNR)", result['ber'] < 0.01,
          f"BER = {result['ber']:.4f}")
+    test("Measured SNR matches target", abs(result['snr_actual_db'] - 40) < 1,
+         f"Expected ~40 dB, got {result['snr_actual_db']:.1f} dB")
+
+    # Noiseless channel (huge SNR, with FEC): every payload bit arrives
+    result_clean = simulate_transmission(
+        message="Noiseless", snr_db=200, distance_km=100,
+        use_fec=True, save_to_db=False, verbose=False
+    )
+    test("Noiseless transmission has BER 0", result_clean['ber'] == 0,
+         f"BER = {result_clean['ber']:.4f}")
 
     # Test 2: Noisy conditions
+    # (snr_db is per SAMPLE; summing 100 samples per symbol adds ~20 dB,
+    # so it takes a negative per-sample SNR to corrupt the payload)
     result_noisy = simulate_transmission(
         message="Test",
-        snr_db=10,
+        snr_db=-25,
         distance_km=1000,
         use_fec=False,
         save_to_db=False
     )
 
     test("Noisy transmission has errors", result_noisy['ber'] > 0,
-         "Expected some errors at 10 dB SNR")
+         "Expected some errors at -25 dB SNR")
 
 except Exception as e:
     test("End-to-end pipeline", False, str(e))
 
+try:
+    # Live downlink: async producer/consumer around the same pipeline
+    from src.runtime.async_downlink import run_async, simulate_live_downlink
+    summary = run_async(simulate_live_downlink, ["Hi", "Bye"],
+                        interval_sec=0, quiet=True, snr_db=40,
+                        distance_km=100)
+    test("Live downlink runs end to end",
+         summary['total_packets'] == 2 and summary['successful_packets'] == 2,
+         f"Got {summary['successful_packets']}/{summary['total_packets']} packets")
+    test("Live downlink keeps packet results",
+         len(summary.get('packets', [])) == 2)
+except Exception as e:
+    test("Live downlink", False, str(e))
+
 print()
 
 # ═══════════════════════════════════════════════════════════════
@@ -284,6 +364,59 @@ if config_path.exists():
 
 print()
 
+# ═══════════════════════════════════════════════════════════════
+# TEST 9: MISSION STORAGE
+# ═══════════════════════════════════════════════════════════════
+
+print("=" * 70)
+print("TEST GROUP 9: Mission Storage")
+print("=" * 70)
+
+try:
+    import tempfile
+    from src.comms.storage import (
+        init_database, save_mission, save_missions, query_missions
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_file = Path(tmp_dir) / "missions.sqlite"
+        init_database(db_file)
+
+        mission_id = save_mission("Hi", "Hi", ber=0.0, snr_db=20,
+                                  packets_total=1,
+                                  metadata={'k': 1, 'snr': np.float32(20.5),
+                                            'bits': np.array([1, 0, 1])},
+                                  db_path=db_file)
+        test("Save single mission", mission_id == 1,
+             f"Expected id 1, got {mission_id}")
+
+        saved = save_missions(
+            [{'message_sent': f"msg {i}", 'message_received': f"msg {i}",
+              'ber': 0.0, 'snr_db': 15} for i in range(5)],
+            db_path=db_file
+        )
+        test("Bulk save missions", saved == 5,
+             f"Expected 5 rows, got {saved}")
+
+        missions = query_missions(limit=None, db_path=db_file)
+        test("Query returns all missions", len(missions) == 6,
+             f"Expected 6 missions, got {len(missions)}")
+        test("Metadata round-trips",
+             any(m['metadata'] == {'k': 1, 'snr': 20.5, 'bits': [1, 0, 1]}
+                 for m in missions))
+
+        # Delete and recreate the file: queries must see the new database
+        db_file.unlink()
+        init_database(db_file)
+        save_mission("New", "New", db_path=db_file)
+        missions = query_missions(limit=None, db_path=db_file)
+        test("Query sees a recreated database", len(missions) == 1,
+             f"Expected 1 mission, got {len(missions)}")
+except Exception as e:
+    test("Mission storage", False, str(e))
+
+print()
+
 # ═══════════════════════════════════════════════════════════════
 # FINAL RESULTS
 # ═══════════════════════════════════════════════════════════════